@@ -27,8 +27,14 @@ from src.core.helpers import (
     upload_arquivo,
 )
 
-# type alias: função que bloqueia até o usuário confirmar o login
-WaitForLoginCallback = Callable[[], None]
+# type alias: função que bloqueia até o usuário confirmar o login;
+# retorna False só se a espera foi interrompida (ex.: app fechado)
+WaitForLoginCallback = Callable[[], bool]
+
+
+class LoginCancelado(Exception):
+    """A espera pelo login foi interrompida (app fechado): a execução é abortada."""
+
 
 def navegar_para_formulario(driver, nome: str, first: bool):
     """
@@ -302,7 +308,10 @@ def executar_bot(wait_for_login_callback: Optional[WaitForLoginCallback] = None)
     if wait_for_login_callback is not None:
         # UI (CustomTkinter) vai abrir um popup e só devolver quando o usuário confirmar
         print("\n[LOGIN] Aguardando confirmação de login pela interface gráfica...")
-        wait_for_login_callback()
+        if not wait_for_login_callback():
+            print("\n[LOGIN] Espera pelo login interrompida. Fechando navegador...")
+            driver.quit()
+            raise LoginCancelado("Login was not confirmed.")
     else:
         # fallback: modo terminal
         print("\n[LOGIN] Faça login manualmente no site na janela do navegador que abriu.")
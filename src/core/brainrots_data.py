@@ -62,4 +62,7 @@ BRAINROT_NAMES = [
     "Las Vaquitas Saturnas",
     "Graipuss Medussi",
     "La Taco Combinasion"
-]
\ No newline at end of file
+]
+
+# versão minúscula (mesma ordem) usada pelo filtro do autocomplete
+BRAINROT_NAMES_LOWER = tuple(name.lower() for name in BRAINROT_NAMES)
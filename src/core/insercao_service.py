@@ -6,6 +6,8 @@
 from __future__ import annotations
 
 import csv
+import re
+from dataclasses import replace
 from pathlib import Path
 from typing import Iterable, List, Union
 
@@ -14,6 +16,9 @@ from src.core.settings import Settings
 
 PathLike = Union[str, Path]
 
+# linha de CSV sem nenhum valor (só vírgulas), como as que o DictReader ignora
+_LINHA_VAZIA_RE = re.compile(rb"^[,\r]*$", re.MULTILINE)
+
 
 def _to_path(p: PathLike) -> Path:
     return p if isinstance(p, Path) else Path(p)
@@ -98,6 +103,41 @@ def carregar_insercao(caminho_csv: PathLike) -> List[ItemInsercao]:
     return itens
 
 
+def contar_insercao(caminho_csv: PathLike) -> int:
+    """
+    Conta os itens de um CSV de inserção sem montar os ItemInsercao.
+
+    Mesmo critério de carregar_insercao (ignora linhas vazias). Sem aspas
+    e com fim de linha \n ou \r\n, cada linha é um registro: conta os
+    b"\n" direto nos bytes. Com aspas (campo com quebra de linha) ou \r
+    sozinho como fim de linha, cai no csv.reader.
+    """
+    caminho = _to_path(caminho_csv)
+
+    if not caminho.exists():
+        return 0
+
+    data = caminho.read_bytes()
+    if not data:
+        return 0
+
+    if b'"' not in data and data.count(b"\r") == data.count(b"\r\n"):
+        linhas = data.count(b"\n")
+        vazias = len(_LINHA_VAZIA_RE.findall(data))
+        if data.endswith(b"\n"):
+            # o "^$" depois do último \n não é uma linha
+            vazias -= 1
+        else:
+            linhas += 1
+        # menos o cabeçalho
+        return max(linhas - vazias - 1, 0)
+
+    with caminho.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # cabeçalho
+        return sum(1 for row in reader if any(row))
+
+
 def salvar_insercao(caminho_csv: PathLike, itens: Iterable[ItemInsercao]) -> None:
     """
     Sobrescreve o CSV informado com os itens fornecidos.
@@ -156,23 +196,41 @@ def adicionar_ou_incrementar_item(
     - Retorna o item resultante (que pode ser o existente incrementado
       ou o novo item).
     """
+    return adicionar_ou_incrementar_itens(caminho_csv, [novo_item])[0]
+
+
+def adicionar_ou_incrementar_itens(
+    caminho_csv: PathLike, novos_itens: Iterable[ItemInsercao]
+) -> List[ItemInsercao]:
+    """
+    Versão em lote de adicionar_ou_incrementar_item: lê o CSV uma vez,
+    aplica todos os itens (mesma regra de identity_key()) e salva uma vez.
+
+    Retorna, na ordem de novos_itens, o item resultante de cada um.
+    """
     caminho = _to_path(caminho_csv)
     itens = carregar_insercao(caminho)
 
-    novo_key = novo_item.identity_key()
-    item_encontrado: ItemInsercao | None = None
-
+    # identity_key -> primeiro item do CSV com essa chave
+    por_chave: dict = {}
     for item in itens:
-        if item.identity_key() == novo_key:
-            item_encontrado = item
-            break
-
-    if item_encontrado is not None:
-        item_encontrado.quantidade += novo_item.quantidade
-        item_resultante = item_encontrado
-    else:
-        itens.append(novo_item)
-        item_resultante = novo_item
+        por_chave.setdefault(item.identity_key(), item)
+
+    resultantes: List[ItemInsercao] = []
+    for novo_item in novos_itens:
+        novo_key = novo_item.identity_key()
+        item_encontrado = por_chave.get(novo_key)
+
+        if item_encontrado is not None:
+            item_encontrado.quantidade += novo_item.quantidade
+            resultantes.append(item_encontrado)
+        else:
+            # cópia: um repetido mais adiante no lote soma na cópia,
+            # não no objeto de quem chamou
+            copia = replace(novo_item)
+            itens.append(copia)
+            por_chave[novo_key] = copia
+            resultantes.append(copia)
 
     salvar_insercao(caminho, itens)
-    return item_resultante
+    return resultantes
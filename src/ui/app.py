@@ -7,24 +7,32 @@ from __future__ import annotations
 
 import os
 import platform
+import queue
+import re
 import subprocess
 import threading
+import time
 import tkinter as tk
+from collections import deque
+from dataclasses import replace
+from decimal import Decimal
 from pathlib import Path
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 
-from src.core.bot import executar_bot
+from src.core.bot import LoginCancelado, executar_bot
 from src.core.insercao_service import (
     nova_insercao,
     adicionar_ou_incrementar_item,
-    carregar_insercao,
+    adicionar_ou_incrementar_itens,
+    contar_insercao,
 )
 from src.core.brainrots_data import BRAINROT_NAMES
 from src.core.brainrot_image_extractor import BrainrotOCRResult, extrair_brainrot
 from src.ui.brainrot_selection_window import BrainrotSelectionWindow, SelectedRegion
 from src.ui.brainrot_review_window import BrainrotReviewWindow
+from src.ui.widgets import AutocompleteEntry, get_font
 from src.core.models import ItemInsercao
 from src.core.settings import Settings
 from src.core.version import short_version
@@ -64,6 +72,70 @@ PALETTE = {
     "log_bg": "#414141",
 }
 
+# estilos de botão compartilhados (cores do PALETTE)
+_ACCENT_BUTTON = {
+    "fg_color": PALETTE["accent"],
+    "hover_color": PALETTE["accent_hover"],
+    "text_color": "black",
+}
+_MUTED_BUTTON = {
+    "fg_color": PALETTE["muted"],
+    "hover_color": PALETTE["muted_hover"],
+    "text_color": PALETTE["text_primary"],
+}
+_DANGER_BUTTON = {
+    "fg_color": PALETTE["danger"],
+    "hover_color": PALETTE["danger_hover"],
+    "text_color": PALETTE["text_primary"],
+}
+# estilo compartilhado dos campos de texto
+_ENTRY = {
+    "fg_color": PALETTE["entry_bg"],
+    "text_color": PALETTE["text_primary"],
+}
+
+# filtros dos diálogos de arquivo (montados uma vez só)
+_IMAGE_FILETYPES = (
+    ("Images", "*.png *.jpg *.jpeg *.webp *.gif"),
+    ("All files", "*.*"),
+)
+_OCR_IMAGE_FILETYPES = (
+    ("Images", "*.png *.jpg *.jpeg *.webp"),
+    ("All files", "*.*"),
+)
+_CSV_FILETYPES = (("CSV files", "*.csv"), ("All files", "*.*"))
+
+# formatos aceitos no formulário manual (checados antes de converter)
+_QTY_RE = re.compile(r"^[1-9]\d*$")
+_PRICE_RE = re.compile(r"^\d+(?:[.,]\d{1,2})?$")
+# formato da product key (checado antes de consultar o servidor)
+_KEY_RE = re.compile(r"^[A-Z0-9]{4}(?:-[A-Z0-9]{4}){3}$")
+
+# contagem de itens por CSV: path -> (mtime_ns, size, item_count)
+_csv_cache: dict[str, tuple[int, int, int]] = {}
+
+# intervalo (s) em que a thread do bot reavalia a espera pelo login
+LOGIN_WAIT_POLL_S = 0.25
+# janela (s) em que trocar de tela reaproveita o último update_info
+INFO_RECHECK_S = 0.5
+# máximo de linhas mantidas no textbox de logs; ao passar disso, as mais
+# antigas saem de uma vez até sobrarem LOG_KEEP_LINES
+LOG_MAX_LINES = 1000
+LOG_KEEP_LINES = 800
+
+
+# sistema operacional (não muda durante a execução)
+_SYSTEM = platform.system()
+_OPEN_COMMAND = "open" if _SYSTEM == "Darwin" else "xdg-open"
+
+
+def _open_with_default_app(path) -> None:
+    """Abre o arquivo no programa padrão do sistema."""
+    if _SYSTEM == "Windows":
+        os.startfile(path)  # type: ignore[attr-defined]
+    else:
+        subprocess.Popen([_OPEN_COMMAND, str(path)])
+
 
 def apply_widget_colors():
     """Global CTk theme configuration."""
@@ -78,12 +150,21 @@ class BotApp(ctk.CTk):
     """Main window with sidebar menu and Add Offers / Configs screens."""
 
     def __init__(self):
+        # Settings.load() é só disco (JSON + mkdir); roda em paralelo com a
+        # criação do Tk/ícone e é aguardado antes de montar os widgets
+        loaded: dict[str, Settings] = {}
+        loader = threading.Thread(
+            target=lambda: loaded.setdefault("settings", Settings.load()),
+            daemon=True,
+        )
+        loader.start()
+
         super().__init__()
         self.title(f"Eldorado Placer {short_version()}")
 
         # window icon
         icon_path = Path(__file__).parent.parent.parent / "assets" / "icon.ico"
-        if platform.system() == "Windows" and icon_path.exists():
+        if _SYSTEM == "Windows" and icon_path.exists():
             self.iconbitmap(default=str(icon_path))
         else:
             # fallback (Linux/macOS)
@@ -97,11 +178,29 @@ class BotApp(ctk.CTk):
         apply_widget_colors()
         self.configure(fg_color=PALETTE["bg"])
 
-        self.settings = Settings.load()
+        loader.join()
+        # se o load falhar na thread, tenta de novo aqui (e deixa o erro subir)
+        self.settings = loaded.get("settings") or Settings.load()
+        # marcado no destroy(); a thread do bot para de esperar a UI
+        self._closed = False
+
+        # logs de qualquer thread entram no buffer e vão para a tela em lote,
+        # num flush agendado só quando há mensagem nova (deque é thread-safe)
+        self._log_buffer: deque[str] = deque()
+        self._log_flush_scheduled = False
+
+        # worker único e reaproveitado para as execuções do bot
+        self._bot_jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._bot_worker: threading.Thread | None = None
+
+        # refresh da tela principal já agendado para o próximo idle
+        self._refresh_pending = False
 
         # content frames (screens)
         self.add_offers_frame: AddOffersFrame | None = None
         self.config_frame: ConfigFrame | None = None
+        # tela empacotada no momento (evita pack/forget ao clicar na atual)
+        self._active_screen: ctk.CTkFrame | None = None
 
         self._build_layout()
         self.show_add_offers()  # initial screen
@@ -112,15 +211,21 @@ class BotApp(ctk.CTk):
     # Main layout: sidebar + content area
     # ------------------------------------------------------------------
     def _build_layout(self):
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        bg = PALETTE["bg"]
+        sidebar_bg = PALETTE["sidebar_bg"]
+        content_bg = PALETTE["content_bg"]
+        text_secondary = PALETTE["text_secondary"]
+
         # main container
-        container = ctk.CTkFrame(self, fg_color=PALETTE["bg"])
+        container = ctk.CTkFrame(self, fg_color=bg)
         container.pack(fill="both", expand=True)
 
         # sidebar
         sidebar = ctk.CTkFrame(
             container,
             width=200,
-            fg_color=PALETTE["sidebar_bg"],
+            fg_color=sidebar_bg,
             corner_radius=0,
         )
         sidebar.pack(side="left", fill="y")
@@ -132,9 +237,7 @@ class BotApp(ctk.CTk):
             text="Add Brainrots",
             command=self.show_add_offers,
             width=150,
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
         )
         self.btn_add_offers.pack(pady=(20, 10))
 
@@ -143,86 +246,87 @@ class BotApp(ctk.CTk):
             text="Configs",
             command=self.show_configs,
             width=150,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
         )
         self.btn_configs.pack(pady=0)
 
         lbl_made = ctk.CTkLabel(
             sidebar,
             text=f"{short_version()}",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             justify="center",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         )
         lbl_made.pack(side="bottom", pady=(0, 20))
 
         lbl_logo = ctk.CTkLabel(
             sidebar,
             text="ELDORADO PLACER",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             justify="center",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         )
         lbl_logo.pack(side="bottom", pady=0)
 
         # content area (right)
         content = ctk.CTkFrame(
             container,
-            fg_color=PALETTE["content_bg"],
+            fg_color=content_bg,
             corner_radius=0,
         )
         content.pack(side="left", fill="both", expand=True)
         self.content = content
 
-        # instantiate screens, but only show one at a time
+        # Add Offers is the initial screen; Configs is only created when first opened
+        # (widgets are built on first show, only one screen visible at a time)
         self.add_offers_frame = AddOffersFrame(content, app=self)
-        self.config_frame = ConfigFrame(content, app=self)
+        self.config_frame = None
 
     # ------------------------------------------------------------------
     # Screen navigation
     # ------------------------------------------------------------------
     def show_add_offers(self):
         """Show Add Offers screen and update button highlight."""
-        if self.config_frame:
+        if self.add_offers_frame is None:
+            return
+        if self._active_screen is self.add_offers_frame:
+            self.add_offers_frame.update_info(allow_recent=True)
+            return
+
+        if self.config_frame is not None:
             self.config_frame.pack_forget()
-        if self.add_offers_frame:
-            self.add_offers_frame.pack(fill="both", expand=True)
-            self.add_offers_frame.update_info()
+        self.add_offers_frame.ensure_built()
+        self.add_offers_frame.pack(fill="both", expand=True)
+        self._active_screen = self.add_offers_frame
+        self.add_offers_frame.update_info(allow_recent=True)
 
         self._highlight_sidebar_button(self.btn_add_offers)
 
     def show_configs(self):
         """Show Configs screen and update button highlight."""
+        if self.config_frame is None:
+            self.config_frame = ConfigFrame(self.content, app=self)
+        if self._active_screen is self.config_frame:
+            self.config_frame.load_from_settings()
+            return
+
         if self.add_offers_frame:
             self.add_offers_frame.pack_forget()
-        if self.config_frame:
-            self.config_frame.pack(fill="both", expand=True)
-            self.config_frame.load_from_settings()
+        self.config_frame.ensure_built()
+        self.config_frame.pack(fill="both", expand=True)
+        self._active_screen = self.config_frame
+        self.config_frame.load_from_settings()
 
         self._highlight_sidebar_button(self.btn_configs)
 
     def _highlight_sidebar_button(self, active_button):
         """Updates sidebar button colors to show which screen is active."""
         # Reset all buttons
-        self.btn_add_offers.configure(
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
-        )
-        self.btn_configs.configure(
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
-        )
+        self.btn_add_offers.configure(**_MUTED_BUTTON)
+        self.btn_configs.configure(**_MUTED_BUTTON)
 
         # Highlight the active one
-        active_button.configure(
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
-        )
+        active_button.configure(**_ACCENT_BUTTON)
 
     # ------------------------------------------------------------------
     # Global actions (called by screens)
@@ -244,12 +348,7 @@ class BotApp(ctk.CTk):
             return
 
         try:
-            if platform.system() == "Windows":
-                os.startfile(path)  # type: ignore[attr-defined]
-            elif platform.system() == "Darwin":
-                subprocess.Popen(["open", str(path)])
-            else:
-                subprocess.Popen(["xdg-open", str(path)])
+            _open_with_default_app(path)
             self._log(f"Opening CSV file: {path}")
         except Exception as e:
             messagebox.showerror(
@@ -258,7 +357,15 @@ class BotApp(ctk.CTk):
             )
 
     def _refresh_main_info(self):
-        """Updates Add Offers screen info (selected file, items)."""
+        """Updates Add Offers screen info (selected file, items) on the next idle tick."""
+        # várias chamadas seguidas (inclusive da thread do bot) viram um refresh só
+        if self._refresh_pending or self._closed:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh_if_pending)
+
+    def _do_refresh_if_pending(self):
+        self._refresh_pending = False
         if self.add_offers_frame:
             self.add_offers_frame.update_info()
 
@@ -266,14 +373,28 @@ class BotApp(ctk.CTk):
     # Bot execution (thread + login popup + final popup)
     # ------------------------------------------------------------------
     def _rodar_bot_thread(self):
-        t = threading.Thread(target=self._rodar_bot, daemon=True)
-        t.start()
+        # daemon de propósito: fechar o app não pode ficar esperando o Selenium
+        # (por isso não um ThreadPoolExecutor, cujas threads são aguardadas na saída)
+        if self._bot_worker is None:
+            self._bot_worker = threading.Thread(
+                target=self._bot_worker_loop, name="bot", daemon=True
+            )
+            self._bot_worker.start()
+        self._bot_jobs.put(self._rodar_bot)
+
+    def _bot_worker_loop(self):
+        """Executa, em ordem, as execuções do bot enfileiradas."""
+        while True:
+            job = self._bot_jobs.get()
+            job()
 
     def _rodar_bot(self):
         self._log("Starting automation (bot)...")
         try:
             executar_bot(wait_for_login_callback=self._wait_for_login_popup_blocking)
             self._log("Automation finished successfully.")
+            if self.add_offers_frame:
+                self.add_offers_frame.mark_csv_dirty()
             self._refresh_main_info()
             self.after(
                 0,
@@ -282,18 +403,29 @@ class BotApp(ctk.CTk):
                     "The insertion has been completed successfully!",
                 ),
             )
+        except LoginCancelado:
+            self._log("[LOGIN] App closed before login was confirmed. Automation aborted.")
         except Exception as e:
             self._log(f"[ERROR] Failed to run the bot: {e}")
 
-    def _wait_for_login_popup_blocking(self):
-        """Called from the bot thread. Shows a popup and blocks until user confirms login."""
+    def _wait_for_login_popup_blocking(self) -> bool:
+        """
+        Called from the bot thread. Shows a popup and blocks until the user
+        confirms login (or closes the popup, which continues the flow anyway).
+        Returns False only if the main window was closed while waiting.
+        """
         event = threading.Event()
 
         def show_popup():
             self._create_login_popup(event)
 
         self.after(0, show_popup)
-        event.wait()
+        # espera em fatias para a thread do bot não ficar presa
+        # se a janela principal for fechada antes do clique
+        while not event.wait(LOGIN_WAIT_POLL_S):
+            if self._closed:
+                return False
+        return True
 
     def _create_login_popup(self, event: threading.Event):
         popup = ctk.CTkToplevel(self)
@@ -325,9 +457,7 @@ class BotApp(ctk.CTk):
             popup,
             text="✅ I'm logged in, continue",
             command=on_confirm,
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
         )
         btn.pack(pady=10)
 
@@ -338,14 +468,35 @@ class BotApp(ctk.CTk):
 
         popup.protocol("WM_DELETE_WINDOW", on_close)
 
+    def destroy(self):
+        self._closed = True
+        super().destroy()
+
     # ------------------------------------------------------------------
     # Logs
     # ------------------------------------------------------------------
     def _log(self, message: str):
         """Centralizes logs: sends them to Add Offers screen (if any) and to the terminal."""
-        if self.add_offers_frame:
-            self.add_offers_frame.append_log(message)
+        # pode ser chamado da thread do bot: a tela é atualizada só no _flush_logs
         print(message)
+        if self._closed:
+            return
+        self._log_buffer.append(message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after_idle(self._flush_logs)
+
+    def _flush_logs(self):
+        """Roda na thread do Tk: junta as mensagens pendentes em um único append."""
+        # limpa o flag antes de drenar: mensagem que chegar depois agenda outro flush
+        self._log_flush_scheduled = False
+        batch: list[str] = []
+        buffer = self._log_buffer
+        while buffer:
+            batch.append(buffer.popleft())
+
+        if batch and self.add_offers_frame:
+            self.add_offers_frame.append_log("\n".join(batch))
 
 
 # ======================================================================
@@ -360,50 +511,74 @@ class AddOffersFrame(ctk.CTkFrame):
         self.lbl_selected_file: ctk.CTkLabel | None = None
         self.lbl_items: ctk.CTkLabel | None = None
         self.txt_logs: ctk.CTkTextbox | None = None
-
-        self._build_ui()
+        # linhas já escritas no textbox (evita perguntar ao Tk a cada flush)
+        self._log_line_count = 0
+        # after() pendente do update_info (várias chamadas seguidas viram uma)
+        self._pending_update_info: str | None = None
+        # último refresh feito: (path, time.monotonic()) para trocas rápidas de tela
+        self._info_checked: tuple[str, float] | None = None
+        # o próprio app gravou no CSV desde o último refresh (força o próximo)
+        self._csv_dirty = True
+        # janela de inserção manual reaproveitada entre aberturas
+        self._manual_window: AddManualWindow | None = None
+
+        # widgets só são criados na primeira vez que a tela aparece
+        self._built = False
+
+    def ensure_built(self):
+        if not self._built:
+            self._build_ui()
+            self._built = True
 
     # ------------------------------------------------------------------
     # UI
     # ------------------------------------------------------------------
     def _build_ui(self):
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        card_bg = PALETTE["card_bg"]
+        content_bg = PALETTE["content_bg"]
+        entry_border = PALETTE["entry_border"]
+        log_bg = PALETTE["log_bg"]
+        text_primary = PALETTE["text_primary"]
+        text_secondary = PALETTE["text_secondary"]
+
         # Title
         lbl_title = ctk.CTkLabel(
             self,
             text="Add Brainrots",
-            font=ctk.CTkFont(size=22, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(22, "bold"),
+            text_color=text_primary,
         )
         lbl_title.pack(anchor="w", padx=20, pady=(20, 10))
 
         # CSV section
-        frame_csv = ctk.CTkFrame(self, fg_color=PALETTE["card_bg"])
+        frame_csv = ctk.CTkFrame(self, fg_color=card_bg)
         frame_csv.pack(fill="x", padx=20, pady=(0, 20))
 
         lbl_csv_title = ctk.CTkLabel(
             frame_csv,
             text="Current Brainrot .CSV",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(14, "bold"),
+            text_color=text_primary,
         )
         lbl_csv_title.pack(anchor="w", padx=10, pady=(10, 5))
 
         self.lbl_selected_file = ctk.CTkLabel(
             frame_csv,
             text="Selected file: (none)",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         )
         self.lbl_selected_file.pack(anchor="w", padx=10, pady=(0, 3))
 
         self.lbl_items = ctk.CTkLabel(
             frame_csv,
             text="Items: 0",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         )
         self.lbl_items.pack(anchor="w", padx=10, pady=(0, 10))
 
         # Open / Clear buttons
-        btns = ctk.CTkFrame(frame_csv, fg_color=PALETTE["card_bg"])
+        btns = ctk.CTkFrame(frame_csv, fg_color=card_bg)
         btns.pack(anchor="e", padx=10, pady=(0, 10))
 
         btn_clear = ctk.CTkButton(
@@ -411,9 +586,7 @@ class AddOffersFrame(ctk.CTkFrame):
             text="Clear file",
             width=110,
             command=self.app.clear_csv_file,
-            fg_color=PALETTE["danger"],
-            hover_color=PALETTE["danger_hover"],
-            text_color=PALETTE["text_primary"],
+            **_DANGER_BUTTON,
         )
         btn_clear.pack(side="left", padx=(0, 10))
 
@@ -422,9 +595,7 @@ class AddOffersFrame(ctk.CTkFrame):
             text="Open file",
             width=110,
             command=self.app.open_csv_file,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
         )
         btn_open.pack(side="left", padx=(0, 10))
         
@@ -432,9 +603,7 @@ class AddOffersFrame(ctk.CTkFrame):
             btns,
             text="Add Manually",
             width=110,
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             command=self._open_manual_window,
         )
         btn_add_manual.pack(side="left", padx=(0, 10))
@@ -443,9 +612,7 @@ class AddOffersFrame(ctk.CTkFrame):
             btns,
             text="Add by Image",
             width=110,
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             command=self._on_add_by_image,
         )
         btn_add_image.pack(side="left", padx=(0, 10))
@@ -454,8 +621,8 @@ class AddOffersFrame(ctk.CTkFrame):
         lbl_logs = ctk.CTkLabel(
             self,
             text="Logs:",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=PALETTE["text_secondary"],
+            font=get_font(14, "bold"),
+            text_color=text_secondary,
         )
         lbl_logs.pack(anchor="w", padx=20)
 
@@ -463,24 +630,22 @@ class AddOffersFrame(ctk.CTkFrame):
             self,
             wrap="word",
             height=130,
-            fg_color=PALETTE["log_bg"],
-            text_color=PALETTE["text_primary"],
-            border_color=PALETTE["entry_border"],
+            fg_color=log_bg,
+            text_color=text_primary,
+            border_color=entry_border,
         )
         self.txt_logs.pack(fill="x", padx=20, pady=(5, 10))
         self.txt_logs.configure(state="disabled")
 
         # Actions row: Add by Image / Add Manually / Start Posting
-        actions = ctk.CTkFrame(self, fg_color=PALETTE["content_bg"])
+        actions = ctk.CTkFrame(self, fg_color=content_bg)
         actions.pack(fill="x", padx=20, pady=(0, 10))
         
         btn_start = ctk.CTkButton(
             actions,
             text="Start Posting",
             width=160,
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             command=self._on_start_posting,
         )
         btn_start.pack(side="right", padx=(10, 0), pady=(0, 10))
@@ -490,28 +655,84 @@ class AddOffersFrame(ctk.CTkFrame):
     # ------------------------------------------------------------------
     # Info / logs
     # ------------------------------------------------------------------
-    def update_info(self):
-        """Updates selected file label and item count."""
+    def update_info(self, allow_recent: bool = False):
+        """
+        Updates selected file label and item count (coalesced within 50 ms).
+
+        allow_recent: só navegação de tela; pula o stat se o mesmo CSV foi
+        checado há menos de INFO_RECHECK_S e o app não gravou nele desde então
+        (quem grava no CSV não passa isso). Fora disso, mostrar a tela refaz
+        um stat só: a contagem sai do cache se o arquivo não mudou.
+        """
+        if self._pending_update_info is not None:
+            return
+        if allow_recent and not self._csv_dirty and self._info_checked is not None:
+            path, checked_at = self._info_checked
+            if (
+                path == str(self.app.settings.csv_ativo_path)
+                and time.monotonic() - checked_at < INFO_RECHECK_S
+            ):
+                return
+        self._pending_update_info = self.after(50, self._do_update_info)
+
+    def mark_csv_dirty(self):
+        """Chamado por quem grava no CSV ativo (pode vir da thread do bot)."""
+        self._csv_dirty = True
+
+    def _do_update_info(self):
+        self._pending_update_info = None
         if not self.lbl_selected_file or not self.lbl_items:
             return
+        self._csv_dirty = False
 
         path = self.app.settings.csv_ativo_path
-        if path and Path(path).exists():
-            self.lbl_selected_file.configure(text=f"Selected file: {path}")
-            try:
-                itens = carregar_insercao(path)
-                self.lbl_items.configure(text=f"Items: {len(itens)}")
-            except Exception:
-                self.lbl_items.configure(text="Items: N/A")
-        else:
+        self._info_checked = (str(path), time.monotonic())
+        # um único stat serve de "exists" e de chave do cache de contagem
+        try:
+            st = os.stat(path) if path else None
+        except OSError:
+            st = None
+
+        if st is None:
             self.lbl_selected_file.configure(text="Selected file: (none)")
             self.lbl_items.configure(text="Items: 0")
+            return
+
+        self.lbl_selected_file.configure(text=f"Selected file: {path}")
+        try:
+            self.lbl_items.configure(text=f"Items: {self._count_items(path, st)}")
+        except Exception:
+            self.lbl_items.configure(text="Items: N/A")
+
+    @staticmethod
+    def _count_items(path, st: os.stat_result) -> int:
+        """Quantidade de itens do CSV, relendo o arquivo só se ele mudou."""
+        key = str(path)
+        cached = _csv_cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
+        count = contar_insercao(path)
+        _csv_cache[key] = (st.st_mtime_ns, st.st_size, count)
+        return count
 
     def append_log(self, message: str):
+        """
+        Escreve direto no textbox (um insert, um see). O agrupamento das
+        mensagens já é feito pelo BotApp._flush_logs.
+        """
         if not self.txt_logs:
             return
+
+        text = message + "\n"
         self.txt_logs.configure(state="normal")
-        self.txt_logs.insert(tk.END, f"{message}\n")
+        self.txt_logs.insert(tk.END, text)
+        self._log_line_count += text.count("\n")
+        if self._log_line_count > LOG_MAX_LINES:
+            # um único delete para todo o excesso
+            excess = self._log_line_count - LOG_KEEP_LINES
+            self.txt_logs.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count = LOG_KEEP_LINES
         self.txt_logs.see(tk.END)
         self.txt_logs.configure(state="disabled")
 
@@ -531,10 +752,7 @@ class AddOffersFrame(ctk.CTkFrame):
         # 1) Escolhe a imagem com os brainrots
         file_path = filedialog.askopenfilename(
             title="Select screenshot with brainrots",
-            filetypes=[
-                ("Images", "*.png *.jpg *.jpeg *.webp"),
-                ("All files", "*.*"),
-            ],
+            filetypes=_OCR_IMAGE_FILETYPES,
         )
         if not file_path:
             return
@@ -550,9 +768,6 @@ class AddOffersFrame(ctk.CTkFrame):
         output_dir.mkdir(parents=True, exist_ok=True)
 
         def _on_regions_selected(regions: list[SelectedRegion]):
-            from decimal import Decimal
-            import re
-
             brainrots_detectados: list[BrainrotOCRResult] = []
 
             # Descobre o próximo índice disponível para não sobrescrever imagens já salvas
@@ -616,8 +831,7 @@ class AddOffersFrame(ctk.CTkFrame):
                     "image_path": str,
                 }
                 """
-                from src.core.insercao_service import adicionar_ou_incrementar_item
-
+                novos_itens: list[ItemInsercao] = []
                 for data in reviewed_items:
                     nome = (data.get("name") or "").strip()
                     if not nome:
@@ -658,11 +872,19 @@ class AddOffersFrame(ctk.CTkFrame):
                         preco=preco,
                     )
 
-                    adicionar_ou_incrementar_item(self.app.settings.csv_ativo_path, item)
+                    novos_itens.append(item)
+
+                # um único load/save do CSV para todos os itens revisados
+                if novos_itens:
+                    adicionar_ou_incrementar_itens(
+                        self.app.settings.csv_ativo_path, novos_itens
+                    )
+                for item in novos_itens:
                     self.app._log(
                         f"[Image Insert] '{item.titulo}' (x{item.quantidade}) added from screenshot."
                     )
 
+                self.mark_csv_dirty()
                 self.update_info()
 
             BrainrotReviewWindow(
@@ -684,7 +906,12 @@ class AddOffersFrame(ctk.CTkFrame):
     # Manual form (mesmo formulário, sem Start Posting)
     # ------------------------------------------------------------------
     def _open_manual_window(self):
-        AddManualWindow(
+        win = self._manual_window
+        if win is not None and win.winfo_exists():
+            win.reopen(self.app.settings)
+            return
+
+        self._manual_window = AddManualWindow(
             master=self.app,
             settings=self.app.settings,
             on_add=self._on_manual_add_item,
@@ -692,13 +919,14 @@ class AddOffersFrame(ctk.CTkFrame):
         )
     
     def _on_manual_add_item(self, item: ItemInsercao):
-        from src.core.insercao_service import adicionar_ou_incrementar_item
         adicionar_ou_incrementar_item(self.app.settings.csv_ativo_path, item)
         self.app._log(f"[Manual Insert] '{item.nome}' added.")
+        self.mark_csv_dirty()
         self.update_info()
 
     def _on_manual_finish(self):
         self.app._log("Manual insertion finished.")
+        self.mark_csv_dirty()
         self.update_info()
 
 # ======================================================================
@@ -712,112 +940,129 @@ class ConfigFrame(ctk.CTkFrame):
         self.entry_profile: ctk.CTkEntry | None = None
         self.entry_csv: ctk.CTkEntry | None = None
         self.txt_descricao_padrao: ctk.CTkTextbox | None = None
+        # valores dos campos de caminho (set() em vez de delete + insert)
+        self._profile_var = tk.StringVar(self, value="")
+        self._csv_var = tk.StringVar(self, value="")
 
-        self._build_ui()
+        # widgets só são criados na primeira vez que a tela aparece
+        self._built = False
+        # save do reset já agendado para o próximo idle
+        self._reset_save_pending = False
+
+    def ensure_built(self):
+        if not self._built:
+            self._build_ui()
+            self._built = True
 
     def _build_ui(self):
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        card_bg = PALETTE["card_bg"]
+        content_bg = PALETTE["content_bg"]
+        entry_bg = PALETTE["entry_bg"]
+        entry_border = PALETTE["entry_border"]
+        text_primary = PALETTE["text_primary"]
+        text_secondary = PALETTE["text_secondary"]
+
         lbl_title = ctk.CTkLabel(
             self,
             text="Configs",
-            font=ctk.CTkFont(size=22, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(22, "bold"),
+            text_color=text_primary,
         )
         lbl_title.pack(anchor="w", padx=20, pady=(20, 15))
 
         padding = {"padx": 20, "pady": 5}
 
         # Chrome profile
-        row_profile = ctk.CTkFrame(self, fg_color=PALETTE["card_bg"])
+        # linhas em grid: label | entry | botão, alinhados à direita
+        row_profile = ctk.CTkFrame(self, fg_color=card_bg)
         row_profile.pack(fill="x", **padding)
+        row_profile.grid_columnconfigure(0, weight=1)
 
         btn_escolher_profile = ctk.CTkButton(
             row_profile,
             text="Browse",
             width=80,
             command=self._choose_profile_dir,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
         )
-        btn_escolher_profile.pack(side="right", padx=5)
+        btn_escolher_profile.grid(row=0, column=2, padx=5)
 
         self.entry_profile = ctk.CTkEntry(
             row_profile,
+            textvariable=self._profile_var,
             width=380,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
-        self.entry_profile.pack(side="right", padx=5)
+        self.entry_profile.grid(row=0, column=1, padx=5)
 
         ctk.CTkLabel(
             row_profile,
             text="Chrome Profile Path:",
-            text_color=PALETTE["text_secondary"],
-        ).pack(side="right", padx=5)
+            text_color=text_secondary,
+        ).grid(row=0, column=0, padx=5, sticky="e")
 
         # CSV path
-        row_csv = ctk.CTkFrame(self, fg_color=PALETTE["card_bg"])
+        row_csv = ctk.CTkFrame(self, fg_color=card_bg)
         row_csv.pack(fill="x", **padding)
+        row_csv.grid_columnconfigure(0, weight=1)
 
         btn_escolher_csv = ctk.CTkButton(
             row_csv,
             text="Browse",
             width=80,
             command=self._choose_csv_file,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
         )
-        btn_escolher_csv.pack(side="right", padx=5)
+        btn_escolher_csv.grid(row=0, column=2, padx=5)
 
         self.entry_csv = ctk.CTkEntry(
             row_csv,
+            textvariable=self._csv_var,
             width=380,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
-        self.entry_csv.pack(side="right", padx=5)
+        self.entry_csv.grid(row=0, column=1, padx=5)
 
         ctk.CTkLabel(
             row_csv,
             text="CSV File Path:",
-            text_color=PALETTE["text_secondary"],
-        ).pack(side="right", padx=5)
+            text_color=text_secondary,
+        ).grid(row=0, column=0, padx=5, sticky="e")
 
         # Default description
-        row_desc = ctk.CTkFrame(self, fg_color=PALETTE["card_bg"])
+        row_desc = ctk.CTkFrame(self, fg_color=card_bg)
         row_desc.pack(fill="x", expand=False, **padding)
+        row_desc.grid_columnconfigure(1, weight=1)
 
         self.txt_descricao_padrao = ctk.CTkTextbox(
             row_desc,
             width=390,
             height=220,
             border_width=2,
-            border_color=PALETTE["entry_border"],
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            border_color=entry_border,
+            fg_color=entry_bg,
+            text_color=text_primary,
         )
-        self.txt_descricao_padrao.pack(
-            side="right", padx=(5, 10), pady=10, fill="x", expand=True
+        self.txt_descricao_padrao.grid(
+            row=0, column=1, padx=(5, 10), pady=10, sticky="ew"
         )
 
         ctk.CTkLabel(
             row_desc,
             text="Default Description:",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
             anchor="n",
-        ).pack(anchor="n", side="right", padx=(10, 5), pady=13)
+        ).grid(row=0, column=0, padx=(10, 5), pady=13, sticky="n")
 
         # Reset / Save buttons
-        frame_btns = ctk.CTkFrame(self, fg_color=PALETTE["content_bg"])
+        frame_btns = ctk.CTkFrame(self, fg_color=content_bg)
         frame_btns.pack(fill="x", pady=(10, 20))
 
         btn_reset = ctk.CTkButton(
             frame_btns,
             text="Reset to Default",
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
             command=self._on_reset_default,
         )
         btn_reset.pack(side="left", padx=20)
@@ -825,9 +1070,7 @@ class ConfigFrame(ctk.CTkFrame):
         btn_save = ctk.CTkButton(
             frame_btns,
             text="Save",
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             command=self._on_save,
         )
         btn_save.pack(side="right", padx=20)
@@ -837,15 +1080,20 @@ class ConfigFrame(ctk.CTkFrame):
         if not self.entry_profile or not self.txt_descricao_padrao or not self.entry_csv:
             return
 
-        self.entry_profile.delete(0, "end")
-        if self.app.settings.chrome_profile_path:
-            self.entry_profile.insert(0, str(self.app.settings.chrome_profile_path))
+        settings = self.app.settings
+        profile = str(settings.chrome_profile_path) if settings.chrome_profile_path else ""
 
-        self.entry_csv.delete(0, "end")
-        self.entry_csv.insert(0, str(self.app.settings.csv_ativo_path))
+        # só reescreve o campo quando o valor mostrado é diferente
+        if self._profile_var.get() != profile:
+            self._profile_var.set(profile)
 
-        self.txt_descricao_padrao.delete("1.0", "end")
-        self.txt_descricao_padrao.insert("1.0", self.app.settings.descricao_padrao)
+        csv_path = str(settings.csv_ativo_path)
+        if self._csv_var.get() != csv_path:
+            self._csv_var.set(csv_path)
+
+        if self.txt_descricao_padrao.get("1.0", "end-1c") != settings.descricao_padrao:
+            self.txt_descricao_padrao.delete("1.0", "end")
+            self.txt_descricao_padrao.insert("1.0", settings.descricao_padrao)
 
     def _choose_profile_dir(self):
         d = filedialog.askdirectory(
@@ -854,9 +1102,8 @@ class ConfigFrame(ctk.CTkFrame):
             if self.app.settings.chrome_profile_path
             else ".",
         )
-        if d and self.entry_profile:
-            self.entry_profile.delete(0, "end")
-            self.entry_profile.insert(0, d)
+        if d:
+            self._profile_var.set(d)
 
     def _choose_csv_file(self):
         initial = (
@@ -867,7 +1114,7 @@ class ConfigFrame(ctk.CTkFrame):
         path = filedialog.asksaveasfilename(
             title="Select CSV file",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=_CSV_FILETYPES,
             initialdir=initial,
             initialfile=(
                 self.app.settings.csv_ativo_path.name
@@ -875,12 +1122,13 @@ class ConfigFrame(ctk.CTkFrame):
                 else "items.csv"
             ),
         )
-        if path and self.entry_csv:
-            self.entry_csv.delete(0, "end")
-            self.entry_csv.insert(0, path)
+        if path:
+            self._csv_var.set(path)
 
     def _on_reset_default(self):
         defaults = Settings.defaults()
+        # cópia para comparar (Settings é dataclass: __eq__ compara os campos)
+        before = replace(self.app.settings)
 
         self.app.settings.chrome_profile_path = defaults.chrome_profile_path
         self.app.settings.descricao_padrao = defaults.descricao_padrao
@@ -888,18 +1136,28 @@ class ConfigFrame(ctk.CTkFrame):
         self.app.settings.pasta_logs = defaults.pasta_logs
         self.app.settings.pasta_imagens = defaults.pasta_imagens
 
-        self.app.settings.save()
         self.load_from_settings()
         self.app._log("Settings reset to default.")
+
+        # já estava no padrão: não reescreve o config.json
+        if self.app.settings != before and not self._reset_save_pending:
+            # grava no idle, depois de a tela já mostrar os valores padrão;
+            # vários resets seguidos viram um único save
+            self._reset_save_pending = True
+            self.after_idle(self._finish_reset)
+
+    def _finish_reset(self):
+        self._reset_save_pending = False
+        self.app.settings.save()
         self.app._refresh_main_info()
 
     def _on_save(self):
         if not self.entry_profile or not self.txt_descricao_padrao or not self.entry_csv:
             return
 
-        profile_str = self.entry_profile.get().strip()
+        profile_str = self._profile_var.get().strip()
         descricao = self.txt_descricao_padrao.get("1.0", "end").strip()
-        csv_path_str = self.entry_csv.get().strip()
+        csv_path_str = self._csv_var.get().strip()
 
         if not csv_path_str:
             messagebox.showerror(
@@ -909,34 +1167,39 @@ class ConfigFrame(ctk.CTkFrame):
             )
             return
 
-        try:
-            # Chrome profile
-            if profile_str:
-                self.app.settings.chrome_profile_path = Path(profile_str)
-            else:
-                self.app.settings.chrome_profile_path = None
-
-            # CSV path
-            csv_path = Path(csv_path_str)
-            if csv_path.suffix.lower() != ".csv":
-                if not messagebox.askyesno(
-                    "CSV extension",
-                    "The selected path does not end with .csv.\nDo you want to use it anyway?",
-                    parent=self,
-                ):
-                    return
+        # valida tudo antes de mexer nas settings (cancelar não deixa estado parcial)
+        csv_path = Path(csv_path_str)
+        if csv_path.suffix.lower() != ".csv":
+            if not messagebox.askyesno(
+                "CSV extension",
+                "The selected path does not end with .csv.\nDo you want to use it anyway?",
+                parent=self,
+            ):
+                return
 
+        settings = self.app.settings
+        new_values = {
+            "chrome_profile_path": Path(profile_str) if profile_str else None,
+            "csv_ativo_path": csv_path,
+        }
+        # default description
+        if descricao:
+            new_values["descricao_padrao"] = descricao
+
+        if all(getattr(settings, k) == v for k, v in new_values.items()):
+            self.app._log("Settings unchanged.")
+            return
+
+        try:
             csv_path.parent.mkdir(parents=True, exist_ok=True)
-            self.app.settings.csv_ativo_path = csv_path
 
-            # default description
-            if descricao.strip():
-                self.app.settings.descricao_padrao = descricao.strip()
+            for key, value in new_values.items():
+                setattr(settings, key, value)
 
             self.app._log(
-                f"Saving settings... chrome_profile_path={self.app.settings.chrome_profile_path}"
+                f"Saving settings... chrome_profile_path={settings.chrome_profile_path}"
             )
-            self.app.settings.save()
+            settings.save()
             self.app._log("Settings saved.")
             self.app._refresh_main_info()
 
@@ -962,10 +1225,13 @@ class LicenseWindow(ctk.CTkToplevel):
         master: ctk.CTk,
         config: LicenseConfig,
         on_success,
+        prior_result: LicenseCheckResult | None = None,
     ):
         super().__init__(master)
         self.config = config
         self.on_success = on_success
+        # resultado já obtido para config.license_key (evita reconsultar o servidor)
+        self.prior_result = prior_result
 
         self.title("Product Key")
         self.geometry("420x230")
@@ -979,21 +1245,24 @@ class LicenseWindow(ctk.CTkToplevel):
         self._build_ui()
 
     def _build_ui(self):
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        danger = PALETTE["danger"]
+        text_primary = PALETTE["text_primary"]
+
         self.columnconfigure(0, weight=1)
 
         lbl_title = ctk.CTkLabel(
             self,
             text="Enter your license key",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(18, "bold"),
+            text_color=text_primary,
         )
         lbl_title.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="n")
 
         self.entry_key = ctk.CTkEntry(
             self,
             width=360,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
             placeholder_text="XXXX-XXXX-XXXX-XXXX",
         )
         self.entry_key.grid(row=1, column=0, padx=20, pady=5, sticky="ew")
@@ -1004,7 +1273,7 @@ class LicenseWindow(ctk.CTkToplevel):
         self.lbl_status = ctk.CTkLabel(
             self,
             text="",
-            text_color=PALETTE["danger"],
+            text_color=danger,
         )
         self.lbl_status.grid(row=2, column=0, padx=20, pady=(4, 0), sticky="w")
 
@@ -1015,9 +1284,7 @@ class LicenseWindow(ctk.CTkToplevel):
             btn_frame,
             text="Activate",
             command=self._on_activate,
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             width=110,
         )
         btn_ok.pack(side="left", padx=5)
@@ -1026,9 +1293,7 @@ class LicenseWindow(ctk.CTkToplevel):
             btn_frame,
             text="Exit",
             command=self._on_cancel,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
             width=110,
         )
         btn_cancel.pack(side="left", padx=5)
@@ -1046,15 +1311,30 @@ class LicenseWindow(ctk.CTkToplevel):
         if not self.entry_key:
             return
 
-        key = self.entry_key.get().strip()
+        key = self.entry_key.get().strip().upper()
         if not key:
             self._set_status("Please enter a key.")
             return
 
-        self._set_status("Checking key with server...")
-        self.update_idletasks()
+        if not _KEY_RE.match(key):
+            self._set_status("Invalid key format. Expected XXXX-XXXX-XXXX-XXXX.")
+            return
+
+        # resultado da checagem de startup vale só para o primeiro clique:
+        # depois disso (chave renovada/desvinculada) sempre pergunta ao servidor
+        prior, self.prior_result = self.prior_result, None
+        if (
+            prior is not None
+            and key == self.config.license_key
+            and not _is_transient_license_reason(prior.reason)
+        ):
+            # mesma chave já recusada agora há pouco: não repete a requisição
+            result = prior
+        else:
+            self._set_status("Checking key with server...")
+            self.update_idletasks()
 
-        result: LicenseCheckResult = verify_license(key, self.config.client_id)
+            result = verify_license(key, self.config.client_id)
 
         if not result.valid:
             reason = result.reason or "unknown_error"
@@ -1084,16 +1364,24 @@ class LicenseWindow(ctk.CTkToplevel):
         self.destroy()
 
 
+def _is_transient_license_reason(reason: str | None) -> bool:
+    """Falhas que podem mudar numa nova tentativa (rede / resposta do servidor)."""
+    reason = reason or ""
+    return reason.startswith(("network_error", "invalid_response_status_"))
+
+
 def ensure_valid_license(master: ctk.CTk) -> bool:
     """
     Ensures there is a valid key for this client_id.
     Uses 'master' (BotApp) as parent window for popups/modals.
     """
     cfg: LicenseConfig = load_config()
+    prior_result: LicenseCheckResult | None = None
 
     # 1) if we already have a saved key, check it first
     if cfg.license_key:
         result = verify_license(cfg.license_key, cfg.client_id)
+        prior_result = result
         if result.valid:
             return True
 
@@ -1112,7 +1400,12 @@ def ensure_valid_license(master: ctk.CTk) -> bool:
     def _on_success(_key: str):
         done["ok"] = True
 
-    win = LicenseWindow(master, cfg, on_success=_on_success)
+    win = LicenseWindow(
+        master,
+        cfg,
+        on_success=_on_success,
+        prior_result=prior_result,
+    )
     master.wait_window(win)  # local loop until the window is closed
 
     return done["ok"]
@@ -1144,25 +1437,31 @@ class InitialSetupWindow(ctk.CTkToplevel):
         self._build_ui()
 
     def _build_ui(self):
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        card_bg = PALETTE["card_bg"]
+        content_bg = PALETTE["content_bg"]
+        text_primary = PALETTE["text_primary"]
+        text_secondary = PALETTE["text_secondary"]
+
         padding = {"padx": 20, "pady": 8}
 
         title = ctk.CTkLabel(
             self,
             text="Initial Setup",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(18, "bold"),
+            text_color=text_primary,
         )
         title.pack(anchor="w", padx=20, pady=(15, 5))
 
         subtitle = ctk.CTkLabel(
             self,
             text="Choose where to store your CSV file and Chrome profile.",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         )
         subtitle.pack(anchor="w", padx=20, pady=(0, 10))
 
         # CSV path row
-        row_csv = ctk.CTkFrame(self, fg_color=PALETTE["card_bg"])
+        row_csv = ctk.CTkFrame(self, fg_color=card_bg)
         row_csv.pack(fill="x", **padding)
 
         btn_csv = ctk.CTkButton(
@@ -1170,31 +1469,28 @@ class InitialSetupWindow(ctk.CTkToplevel):
             text="Browse",
             width=70,
             command=self._choose_csv_file,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
         )
         btn_csv.pack(side="right", padx=5)
 
         self.entry_csv = ctk.CTkEntry(
             row_csv,
             width=260,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
         self.entry_csv.pack(side="right", padx=5)
 
         ctk.CTkLabel(
             row_csv,
             text="CSV File Path:",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         ).pack(side="right", padx=5)
 
         default_csv = str(self.settings.csv_ativo_path)
         self.entry_csv.insert(0, default_csv)
 
         # Chrome profile row
-        row_profile = ctk.CTkFrame(self, fg_color=PALETTE["card_bg"])
+        row_profile = ctk.CTkFrame(self, fg_color=card_bg)
         row_profile.pack(fill="x", **padding)
 
         btn_profile = ctk.CTkButton(
@@ -1202,24 +1498,21 @@ class InitialSetupWindow(ctk.CTkToplevel):
             text="Browse",
             width=70,
             command=self._choose_profile_dir,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
         )
         btn_profile.pack(side="right", padx=5)
 
         self.entry_profile = ctk.CTkEntry(
             row_profile,
             width=260,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
         self.entry_profile.pack(side="right", padx=5)
 
         ctk.CTkLabel(
             row_profile,
             text="Chrome Profile Path:",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         ).pack(side="right", padx=5)
 
         default_profile = (
@@ -1230,15 +1523,13 @@ class InitialSetupWindow(ctk.CTkToplevel):
         self.entry_profile.insert(0, default_profile)
 
         # Buttons
-        btn_row = ctk.CTkFrame(self, fg_color=PALETTE["content_bg"])
+        btn_row = ctk.CTkFrame(self, fg_color=content_bg)
         btn_row.pack(fill="x", padx=20, pady=(15, 15))
 
         btn_cancel = ctk.CTkButton(
             btn_row,
             text="Exit",
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
             command=self._on_cancel,
             width=110,
         )
@@ -1247,9 +1538,7 @@ class InitialSetupWindow(ctk.CTkToplevel):
         btn_ok = ctk.CTkButton(
             btn_row,
             text="Continue",
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             command=self._on_confirm,
             width=120,
         )
@@ -1264,7 +1553,7 @@ class InitialSetupWindow(ctk.CTkToplevel):
         path = filedialog.asksaveasfilename(
             title="Select CSV file",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=_CSV_FILETYPES,
             initialdir=initial,
             initialfile=self.settings.csv_ativo_path.name
             if self.settings.csv_ativo_path
@@ -1324,151 +1613,6 @@ class InitialSetupWindow(ctk.CTkToplevel):
         self.destroy()
 
 
-# ======================================================================
-# AutocompleteEntry (Name field)
-# ======================================================================
-class AutocompleteEntry(ctk.CTkEntry):
-    def __init__(
-        self,
-        master,
-        suggestions: list[str],
-        on_select=None,
-        *args,
-        **kwargs,
-    ):
-        super().__init__(master, *args, **kwargs)
-        self.suggestions = suggestions
-        self.on_select = on_select  # callback ao selecionar
-
-        self._dropdown: tk.Toplevel | None = None
-        self._listbox: tk.Listbox | None = None
-
-        self.bind("<KeyRelease>", self._on_keyrelease)
-        self.bind("<Down>", self._on_down)
-        self.bind("<Return>", self._on_return)
-        self.bind("<FocusOut>", self._on_focus_out)
-
-        # estilo do dropdown
-        self.dropdown_bg = "#2F2F2F"
-        self.dropdown_border = "#2F2F2F"
-        self.dropdown_text = "#F9FAFB"
-        self.dropdown_select_bg = "#E5A000"
-        self.dropdown_select_fg = "#000000"
-
-    # --------------------------------------------------
-    # helpers de dropdown / listbox
-    # --------------------------------------------------
-    def _create_dropdown(self):
-        if self._dropdown is not None:
-            return
-
-        self._dropdown = tk.Toplevel(self)
-        self._dropdown.wm_overrideredirect(True)
-        self._dropdown.configure(bg=self.dropdown_border)
-
-        x = self.winfo_rootx()
-        y = self.winfo_rooty() + self.winfo_height()
-        self._dropdown.geometry(f"+{x}+{y}")
-
-        frame = tk.Frame(self._dropdown, bg=self.dropdown_border, bd=2)
-        frame.pack(fill="both", expand=True)
-
-        self._listbox = tk.Listbox(
-            frame,
-            height=6,
-            borderwidth=0,
-            highlightthickness=0,
-            background=self.dropdown_bg,
-            foreground=self.dropdown_text,
-            selectbackground=self.dropdown_select_bg,
-            selectforeground=self.dropdown_select_fg,
-            relief="flat",
-            font=("Segoe UI", 11),
-        )
-        self._listbox.pack(fill="both", expand=True, padx=4, pady=3)
-
-        self._listbox.bind("<<ListboxSelect>>", self._on_listbox_click)
-        self._listbox.bind("<ButtonRelease-1>", self._on_listbox_click)
-
-    def _destroy_dropdown(self):
-        if self._dropdown is not None:
-            self._dropdown.destroy()
-            self._dropdown = None
-            self._listbox = None
-
-    # --------------------------------------------------
-    # eventos
-    # --------------------------------------------------
-    def _on_keyrelease(self, event):
-        if event.keysym in ("Return", "Up", "Down"):
-            return
-
-        text = self.get().strip()
-        if not text:
-            self._destroy_dropdown()
-            return
-
-        lowercase = text.lower()
-        matches = [s for s in self.suggestions if lowercase in s.lower()]
-
-        if not matches:
-            self._destroy_dropdown()
-            return
-
-        self._create_dropdown()
-        assert self._listbox is not None
-        self._listbox.delete(0, tk.END)
-        for item in matches:
-            self._listbox.insert(tk.END, f"  {item}  ")
-
-        self._listbox.selection_clear(0, tk.END)
-        self._listbox.selection_set(0)
-        self._listbox.activate(0)
-
-    def _on_down(self, event):
-        if self._listbox is None:
-            return "break"
-        cur = self._listbox.curselection()
-        if not cur:
-            idx = 0
-        else:
-            idx = cur[0] + 1
-        if idx >= self._listbox.size():
-            idx = self._listbox.size() - 1
-        self._listbox.selection_clear(0, tk.END)
-        self._listbox.selection_set(idx)
-        self._listbox.activate(idx)
-        return "break"
-
-    def _on_return(self, event):
-        if self._listbox is not None:
-            self._apply_selection()
-            return "break"
-
-    def _on_focus_out(self, event):
-        self.after(150, self._destroy_dropdown)
-
-    def _on_listbox_click(self, event):
-        self._apply_selection()
-
-    # --------------------------------------------------
-    # seleção de item
-    # --------------------------------------------------
-    def _apply_selection(self):
-        if self._listbox is None:
-            return
-        cur = self._listbox.curselection()
-        if not cur:
-            return
-
-        text = self._listbox.get(cur[0]).strip()
-        self.delete(0, tk.END)
-        self.insert(0, text)
-        self._destroy_dropdown()
-
-        if callable(self.on_select):
-            self.on_select(text)
-
 class AddManualWindow(ctk.CTkToplevel):
     """
     Janela simples para adicionar itens manualmente.
@@ -1499,164 +1643,174 @@ class AddManualWindow(ctk.CTkToplevel):
         self.grab_set()
         self.resizable(False, False)
 
+        # fechar no "X" só esconde a janela (ela é reaproveitada)
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+
         self.use_default_desc_var = ctk.BooleanVar(value=True)
+        # variáveis dos campos: limpar o form vira um set() por campo
+        self._nome_var = ctk.StringVar()
+        self._titulo_var = ctk.StringVar()
+        self._img_var = ctk.StringVar()
+        self._qtd_var = ctk.StringVar(value="1")
+        self._preco_var = ctk.StringVar(value="0.00")
+        # descrição padrão que está no textbox agora (None = usuário pode ter editado)
+        self._desc_cached_default: str | None = None
+        # campo destacado pelo último erro de validação + cor de borda original
+        self._error_entry: ctk.CTkEntry | None = None
+        self._error_entry_border = None
 
         self._build_ui()
 
+        # erro some assim que o usuário mexe em um dos campos validados
+        for var in (self._nome_var, self._qtd_var, self._preco_var):
+            var.trace_add("write", self._clear_error)
+
     def _build_ui(self):
-        padding = {"padx": 10, "pady": 5}
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        accent = PALETTE["accent"]
+        card_bg = PALETTE["card_bg"]
+        content_bg = PALETTE["content_bg"]
+        entry_bg = PALETTE["entry_bg"]
+        entry_border = PALETTE["entry_border"]
+        muted_hover = PALETTE["muted_hover"]
+        text_primary = PALETTE["text_primary"]
+        text_secondary = PALETTE["text_secondary"]
 
         title = ctk.CTkLabel(
             self,
             text="Add Brainrot Manually",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(18, "bold"),
+            text_color=text_primary,
         )
         title.pack(pady=(10, 10))
 
-        frame = ctk.CTkFrame(self, fg_color=PALETTE["card_bg"])
+        frame = ctk.CTkFrame(self, fg_color=card_bg)
         frame.pack(fill="both", expand=True, padx=20, pady=10)
+        # um grid só para as linhas do formulário (label | campo | botão),
+        # em vez de um frame + pack por linha
+        frame.grid_columnconfigure(0, weight=1)
 
         # NAME
-        row_nome = ctk.CTkFrame(frame, fg_color=PALETTE["card_bg"])
-        row_nome.pack(fill="x", **padding)
+        ctk.CTkLabel(
+            frame, text="Name:", text_color=text_secondary
+        ).grid(row=0, column=0, sticky="e", padx=5, pady=5)
 
         self.entry_nome = AutocompleteEntry(
-            row_nome,
+            frame,
+            textvariable=self._nome_var,
             suggestions=BRAINROT_NAMES,
             on_select=self._on_brainrot_selected,
             width=380,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
-        self.entry_nome.pack(side="right", padx=(5, 10))
-
-        ctk.CTkLabel(
-            row_nome, text="Name:", text_color=PALETTE["text_secondary"]
-        ).pack(side="right", padx=5)
+        self.entry_nome.grid(row=0, column=1, columnspan=2, sticky="e", padx=(5, 20), pady=5)
 
         # TITLE
-        row_titulo = ctk.CTkFrame(frame, fg_color=PALETTE["card_bg"])
-        row_titulo.pack(fill="x", **padding)
+        ctk.CTkLabel(
+            frame, text="Title:", text_color=text_secondary
+        ).grid(row=1, column=0, sticky="e", padx=5, pady=5)
 
         self.entry_titulo = ctk.CTkEntry(
-            row_titulo,
+            frame,
+            textvariable=self._titulo_var,
             width=380,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
-        self.entry_titulo.pack(side="right", padx=(5, 10))
+        self.entry_titulo.grid(row=1, column=1, columnspan=2, sticky="e", padx=(5, 20), pady=5)
 
+        # IMAGE
         ctk.CTkLabel(
-            row_titulo, text="Title:", text_color=PALETTE["text_secondary"]
-        ).pack(side="right", padx=5)
+            frame, text="Image:", text_color=text_secondary
+        ).grid(row=2, column=0, sticky="e", padx=5, pady=5)
 
-        # IMAGE
-        row_img = ctk.CTkFrame(frame, fg_color=PALETTE["card_bg"])
-        row_img.pack(fill="x", **padding)
+        self.entry_img = ctk.CTkEntry(
+            frame,
+            textvariable=self._img_var,
+            width=300,
+            **_ENTRY,
+        )
+        self.entry_img.grid(row=2, column=1, padx=5, pady=5)
 
         btn_escolher_img = ctk.CTkButton(
-            row_img,
+            frame,
             text="Browse...",
             width=80,
             command=self._on_escolher_imagem,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
         )
-        btn_escolher_img.pack(side="right", padx=(5, 10))
-
-        self.entry_img = ctk.CTkEntry(
-            row_img,
-            width=300,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
-        )
-        self.entry_img.pack(side="right", padx=5)
-
-        ctk.CTkLabel(
-            row_img, text="Image:", text_color=PALETTE["text_secondary"]
-        ).pack(side="right", padx=5)
+        btn_escolher_img.grid(row=2, column=2, padx=(5, 20), pady=5)
 
         # DEFAULT DESC CHECKBOX
-        row_chk = ctk.CTkFrame(frame, fg_color=PALETTE["card_bg"])
-        row_chk.pack(fill="x", **padding)
         self.chk_desc_padrao = ctk.CTkCheckBox(
-            row_chk,
+            frame,
             text="Use Default Description?",
             variable=self.use_default_desc_var,
             command=self._toggle_desc,
-            text_color=PALETTE["text_secondary"],
-            fg_color=PALETTE["entry_bg"],
-            hover_color=PALETTE["muted_hover"],
-            border_color=PALETTE["entry_border"],
-            checkmark_color=PALETTE["accent"],
+            text_color=text_secondary,
+            fg_color=entry_bg,
+            hover_color=muted_hover,
+            border_color=entry_border,
+            checkmark_color=accent,
         )
-        self.chk_desc_padrao.pack(anchor="w", padx=5)
+        self.chk_desc_padrao.grid(row=3, column=0, columnspan=3, sticky="w", padx=15, pady=5)
 
         # DESCRIPTION
-        row_desc = ctk.CTkFrame(frame, fg_color=PALETTE["card_bg"])
-        row_desc.pack(fill="x", **padding)
-
-        self.txt_descricao = ctk.CTkTextbox(
-            row_desc,
-            width=380,
-            height=90,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
-            border_color=PALETTE["entry_border"],
-            border_width=2,
-        )
-        self.txt_descricao.pack(side="right", padx=(5, 10))
         ctk.CTkLabel(
-            row_desc, text="Description:", text_color=PALETTE["text_secondary"]
-        ).pack(side="right", padx=5, anchor="n")
+            frame, text="Description:", text_color=text_secondary
+        ).grid(row=4, column=0, sticky="ne", padx=5, pady=5)
 
-        self.txt_descricao.insert("1.0", self.settings.descricao_padrao)
-        self._toggle_desc()
+        # o textbox só é criado quando o usuário desmarca a descrição padrão;
+        # até lá um frame vazio segura o espaço dele
+        self._desc_holder = ctk.CTkFrame(
+            frame, width=380, height=90, fg_color=card_bg
+        )
+        self._desc_holder.grid(row=4, column=1, columnspan=2, sticky="e", padx=(5, 20), pady=5)
+        self.txt_descricao: ctk.CTkTextbox | None = None
 
         # PRICE + QTY
-        row_bottom = ctk.CTkFrame(frame, fg_color=PALETTE["card_bg"])
-        row_bottom.pack(fill="x", **padding)
+        row_bottom = ctk.CTkFrame(frame, fg_color=card_bg)
+        row_bottom.grid(row=5, column=0, columnspan=3, sticky="ew", padx=10, pady=5)
 
         self.entry_preco = ctk.CTkEntry(
             row_bottom,
+            textvariable=self._preco_var,
             width=150,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
-        self.entry_preco.insert(0, "0.00")
         self.entry_preco.pack(side="right", padx=(5, 10))
 
         lbl_price = ctk.CTkLabel(
-            row_bottom, text="Price:", text_color=PALETTE["text_secondary"]
+            row_bottom, text="Price:", text_color=text_secondary
         )
         lbl_price.pack(side="right", padx=5)
 
         self.entry_quantidade = ctk.CTkEntry(
             row_bottom,
+            textvariable=self._qtd_var,
             width=150,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            **_ENTRY,
         )
-        self.entry_quantidade.insert(0, "1")
         self.entry_quantidade.pack(side="right", padx=(5, 10))
 
         lbl_qty = ctk.CTkLabel(
-            row_bottom, text="Quantity:", text_color=PALETTE["text_secondary"]
+            row_bottom, text="Quantity:", text_color=text_secondary
         )
         lbl_qty.pack(side="right", padx=5)
 
+        # erro de validação inline (no lugar de um messagebox por erro)
+        self.lbl_error = ctk.CTkLabel(
+            frame, text="", text_color=PALETTE["danger"]
+        )
+        self.lbl_error.grid(row=6, column=0, columnspan=3, sticky="w", padx=15)
+
         # BUTTONS
-        btn_row = ctk.CTkFrame(self, fg_color=PALETTE["content_bg"])
+        btn_row = ctk.CTkFrame(self, fg_color=content_bg)
         btn_row.pack(fill="x", pady=(0, 15), padx=20)
 
         btn_cancel = ctk.CTkButton(
             btn_row,
             text="Cancel",
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
-            text_color=PALETTE["text_primary"],
+            **_MUTED_BUTTON,
             command=self._cancel,
         )
         btn_cancel.pack(side="left", padx=5)
@@ -1664,9 +1818,7 @@ class AddManualWindow(ctk.CTkToplevel):
         btn_finish = ctk.CTkButton(
             btn_row,
             text="Finish",
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             command=self._finish,
         )
         btn_finish.pack(side="right", padx=5)
@@ -1675,9 +1827,7 @@ class AddManualWindow(ctk.CTkToplevel):
         btn_add = ctk.CTkButton(
             btn_row,
             text="Add More",
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
-            text_color="black",
+            **_ACCENT_BUTTON,
             command=self._add_item,
         )
         btn_add.pack(side="right", padx=5)
@@ -1686,72 +1836,100 @@ class AddManualWindow(ctk.CTkToplevel):
     # Helpers
     # ------------------------------------------------------------------
     def _on_brainrot_selected(self, name: str):
-        self.entry_titulo.delete(0, "end")
-        self.entry_titulo.insert(0, name)
+        self._titulo_var.set(name)
+
+    def _build_desc_textbox(self):
+        self.txt_descricao = ctk.CTkTextbox(
+            self._desc_holder,
+            width=380,
+            height=90,
+            fg_color=PALETTE["entry_bg"],
+            text_color=PALETTE["text_primary"],
+            border_color=PALETTE["entry_border"],
+            border_width=2,
+        )
+        self.txt_descricao.pack()
+        # parte da descrição padrão, como antes
+        self.txt_descricao.insert("1.0", self.settings.descricao_padrao)
 
     def _toggle_desc(self):
+        if self.txt_descricao is None:
+            if self.use_default_desc_var.get():
+                return
+            self._build_desc_textbox()
+
         if self.use_default_desc_var.get():
-            self.txt_descricao.configure(state="normal")
-            self.txt_descricao.delete("1.0", "end")
-            self.txt_descricao.insert("1.0", self.settings.descricao_padrao)
+            default = self.settings.descricao_padrao
+            if self._desc_cached_default != default:
+                # só reescreve o textbox se o conteúdo realmente mudou
+                self.txt_descricao.configure(state="normal")
+                self.txt_descricao.delete("1.0", "end")
+                self.txt_descricao.insert("1.0", default)
+                self._desc_cached_default = default
             self.txt_descricao.configure(state="disabled")
         else:
             self.txt_descricao.configure(state="normal")
+            # a partir daqui o texto pode ser editado
+            self._desc_cached_default = None
 
     def _on_escolher_imagem(self):
         file_path = filedialog.askopenfilename(
             title="Select brainrot image",
-            filetypes=[
-                ("Images", "*.png *.jpg *.jpeg *.webp *.gif"),
-                ("All files", "*.*"),
-            ],
+            filetypes=_IMAGE_FILETYPES,
         )
         if file_path:
-            self.entry_img.delete(0, "end")
-            self.entry_img.insert(0, file_path)
+            self._img_var.set(file_path)
 
     # ------------------------------------------------------------------
     # IData extraction
     # ------------------------------------------------------------------
-    def _build_item(self):
-        from decimal import Decimal
-
-        nome = self.entry_nome.get().strip()
-        titulo = self.entry_titulo.get().strip()
-        img = self.entry_img.get().strip()
-        qty = self.entry_quantidade.get().strip()
-        price = self.entry_preco.get().strip()
-
+    def _snapshot_form(self) -> dict[str, str]:
+        """Lê cada campo uma vez (o mesmo snapshot serve para checar e montar o item)."""
+        if self.use_default_desc_var.get():
+            descricao = ""
+        else:
+            descricao = self.txt_descricao.get("1.0", "end").strip()
+
+        return {
+            "nome": self._nome_var.get().strip(),
+            "titulo": self._titulo_var.get().strip(),
+            "img": self._img_var.get().strip(),
+            "qty": self._qtd_var.get().strip(),
+            "price": self._preco_var.get().strip(),
+            "descricao": descricao,
+        }
+
+    def _build_item(self, values: dict[str, str] | None = None):
+        if values is None:
+            values = self._snapshot_form()
+        nome = values["nome"]
+        titulo = values["titulo"]
+        img = values["img"]
+        qty = values["qty"]
+        price = values["price"]
+
+        # uma passada só: a primeira regra que falhar vira a única mensagem
         if not nome:
-            messagebox.showerror("Validation error", "Name is required.", parent=self)
-            return None
-
-        if not qty:
-            messagebox.showerror("Validation error", "Quantity is required.", parent=self)
-            return None
+            erro, campo = "Name is required.", self.entry_nome
+        elif not qty:
+            erro, campo = "Quantity is required.", self.entry_quantidade
+        elif not price:
+            erro, campo = "Price is required.", self.entry_preco
+        elif not _QTY_RE.match(qty):
+            erro, campo = "Invalid quantity.", self.entry_quantidade
+        elif not _PRICE_RE.match(price):
+            erro, campo = "Invalid price.", self.entry_preco
+        else:
+            erro = campo = None
 
-        if not price:
-            messagebox.showerror("Validation error", "Price is required.", parent=self)
+        if erro is not None:
+            self._show_error(campo, erro)
             return None
 
-        try:
-            quantidade = int(qty)
-            if quantidade <= 0:
-                raise ValueError
-        except:
-            messagebox.showerror("Validation error", "Invalid quantity.", parent=self)
-            return None
+        quantidade = int(qty)
+        preco = Decimal(price.replace(",", "."))
 
-        try:
-            preco = Decimal(price.replace(",", "."))
-        except:
-            messagebox.showerror("Validation error", "Invalid price.", parent=self)
-            return None
-
-        if self.use_default_desc_var.get():
-            descricao = "DEFAULT"
-        else:
-            descricao = self.txt_descricao.get("1.0", "end").strip() or "DEFAULT"
+        descricao = values["descricao"] or "DEFAULT"
 
         if not titulo:
             titulo = nome
@@ -1765,6 +1943,22 @@ class AddManualWindow(ctk.CTkToplevel):
             preco=preco,
         )
 
+    def _show_error(self, entry: ctk.CTkEntry, message: str):
+        """Mostra o erro abaixo do form e destaca o campo com problema."""
+        self._clear_error()
+        self._error_entry = entry
+        self._error_entry_border = entry.cget("border_color")
+        entry.configure(border_color=PALETTE["danger"])
+        self.lbl_error.configure(text=message)
+        entry.focus_set()
+
+    def _clear_error(self, *_):
+        if self._error_entry is None:
+            return
+        self._error_entry.configure(border_color=self._error_entry_border)
+        self._error_entry = None
+        self.lbl_error.configure(text="")
+
     # ------------------------------------------------------------------
     # Buttons actions
     # ------------------------------------------------------------------
@@ -1776,23 +1970,38 @@ class AddManualWindow(ctk.CTkToplevel):
         self._clear_form()
 
     def _finish(self):
-        item = self._build_item()
+        values = self._snapshot_form()
+        item = self._build_item(values)
         if item:
             self.on_add(item)
         self.on_finish()
-        self.destroy()
+        self._hide()
 
     def _cancel(self):
-        self.destroy()
+        self._hide()
+
+    # ------------------------------------------------------------------
+    # Reaproveitamento da janela
+    # ------------------------------------------------------------------
+    def _hide(self):
+        self.grab_release()
+        self.withdraw()
+
+    def reopen(self, settings):
+        """Mostra de novo a janela escondida, com o formulário limpo."""
+        self.settings = settings
+        self._clear_form()
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.entry_nome.focus_set()
 
     def _clear_form(self):
-        self.entry_nome.delete(0, "end")
-        self.entry_titulo.delete(0, "end")
-        self.entry_img.delete(0, "end")
-        self.entry_quantidade.delete(0, "end")
-        self.entry_quantidade.insert(0, "1")
-        self.entry_preco.delete(0, "end")
-        self.entry_preco.insert(0, "0.00")
+        self._nome_var.set("")
+        self._titulo_var.set("")
+        self._img_var.set("")
+        self._qtd_var.set("1")
+        self._preco_var.set("0.00")
         self.use_default_desc_var.set(True)
         self._toggle_desc()
 
@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
+import re
+import tkinter as tk
+import tkinter.messagebox as messagebox
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, List, Optional
 
-import re
-from decimal import Decimal, InvalidOperation
 import customtkinter as ctk
 from PIL import Image
-import tkinter as tk
-import tkinter.messagebox as messagebox
-import re
-from difflib import SequenceMatcher
 
 from src.core.brainrots_data import BRAINROT_NAMES
+from src.ui.widgets import AutocompleteEntry, get_font
 
 # =========================
 # PALETTE / THEME
@@ -45,6 +48,21 @@ PALETTE = {
     "log_bg": "#414141",
 }
 
+# preço digitado: dígitos com no máximo um ponto ("12.", ".5" são arrumados no focus out)
+_PRECO_RE = re.compile(r"\d*\.?\d*")
+# preço guardado com 2 casas (Decimal, sem passar por float)
+_CENTAVOS = Decimal("0.01")
+# linhas de widgets criadas no resumo final (o resto é rolagem)
+SUMMARY_VISIBLE_ROWS = 4
+# espera (ms) após a última tecla em nome/variação/gen antes de refazer o título
+TITLE_PREVIEW_DEBOUNCE_MS = 50
+# "/s" no fim do gen (qualquer caixa), removido antes de recompor "$x/s"
+_GEN_SUFFIX_RE = re.compile(r"/s$", re.IGNORECASE)
+# tamanho máximo do preview do crop na revisão
+THUMB_MAX_SIZE = (400, 400)
+# previews decodificados guardados por janela (LRU; cobre atual ± vizinhas)
+THUMB_CACHE_SIZE = 8
+
 
 # -------------------------------------------------------------------
 # Helpers para normalizar / casar nome com catálogo
@@ -54,17 +72,136 @@ def _normalize_name(s: str) -> str:
     return " ".join(s.lower().split())
 
 
+# catálogo padrão já normalizado: (índice, nome original, nome normalizado, matcher).
+# O SequenceMatcher analisa o seq2 (b2j, contagens) uma vez só; a cada busca
+# só troca o seq1 com set_seq1(). Nomes são curtos: autojunk não serve aqui.
+_CATALOG_MATCHERS = tuple(
+    (idx, name, norm, SequenceMatcher(None, b=norm, autojunk=False))
+    for idx, (name, norm) in enumerate(
+        (name, _normalize_name(name)) for name in BRAINROT_NAMES
+    )
+)
+
+# nome normalizado -> nome original (acerto exato do OCR; o primeiro vence,
+# como no empate da varredura)
+_CATALOG_BY_NORM: dict[str, str] = {
+    norm: name for _idx, name, norm, _sm in reversed(_CATALOG_MATCHERS)
+}
+
+# primeira letra -> catálogo com os nomes dessa letra na frente (montado sob demanda)
+_CATALOG_BY_FIRST: dict[str, tuple] = {}
+
+
+def _catalog_order(first: str) -> tuple:
+    """
+    Catálogo começando pelo "balde" da primeira letra da query: o OCR quase
+    sempre acerta a inicial, então o melhor aparece cedo e os cortes por
+    limite descartam o resto sem chegar no ratio().
+    """
+    order = _CATALOG_BY_FIRST.get(first)
+    if order is None:
+        bucket = tuple(c for c in _CATALOG_MATCHERS if c[2][:1] == first)
+        order = bucket + tuple(c for c in _CATALOG_MATCHERS if c[2][:1] != first)
+        _CATALOG_BY_FIRST[first] = order
+    return order
+
+
 def best_catalog_match(query: str, catalog: list[str], min_ratio: float = 0.62) -> str | None:
     """Retorna o nome do catálogo mais parecido com 'query', se passar do limiar."""
     q = _normalize_name(query)
-    best_name, best_score = None, 0.0
-    for cand in catalog:
-        score = SequenceMatcher(None, q, _normalize_name(cand)).ratio()
-        if score > best_score:
-            best_name, best_score = cand, score
+    if catalog is BRAINROT_NAMES:
+        return _best_default_match(q, min_ratio)
+    candidatos = [
+        (idx, cand, _normalize_name(cand), None) for idx, cand in enumerate(catalog)
+    ]
+    return _scan_catalog(q, candidatos, min_ratio)
+
+
+@lru_cache(maxsize=1024)
+def _best_default_match(q: str, min_ratio: float) -> str | None:
+    """
+    Busca no catálogo padrão, memoizada pela query normalizada: o OCR repete
+    muito os mesmos nomes (no mesmo print e entre prints), e o catálogo não muda.
+    """
+    # ratio() == 1.0 só com nome idêntico: nenhum outro candidato ganha
+    exato = _CATALOG_BY_NORM.get(q)
+    if exato is not None:
+        return exato
+    return _scan_catalog(q, _catalog_order(q[:1]), min_ratio)
+
+
+def _scan_catalog(q: str, candidatos, min_ratio: float) -> str | None:
+    # empate fica com o que vem antes no catálogo (idx), independente da
+    # ordem de visita, então o resultado é o mesmo de uma varredura em ordem
+    lq = len(q)
+    best_name, best_score, best_idx = None, 0.0, -1
+    for idx, cand, ncand, sm in candidatos:
+        # ratio() <= 2*min(len)/soma(len): se nem isso passa do limiar
+        # (ou do melhor até agora), nem chega no SequenceMatcher
+        lc = len(ncand)
+        limite = 2.0 * min(lq, lc) / (lq + lc) if lq + lc else 1.0
+        if (
+            limite < min_ratio
+            or limite < best_score
+            or (limite == best_score and idx > best_idx)
+        ):
+            continue
+        if sm is None:
+            sm = SequenceMatcher(None, q, ncand, autojunk=False)
+        else:
+            sm.set_seq1(q)
+        # quick_ratio() (contagem de caracteres) também é teto do ratio()
+        limite = sm.quick_ratio()
+        if (
+            limite < min_ratio
+            or limite < best_score
+            or (limite == best_score and idx > best_idx)
+        ):
+            continue
+        score = sm.ratio()
+        if score > best_score or (score == best_score and idx < best_idx):
+            best_name, best_score, best_idx = cand, score, idx
     return best_name if best_name and best_score >= min_ratio else None
 
 
+def _set_if_changed(var: tk.Variable, value) -> None:
+    """set() só quando muda: evita disparar traces e redesenhar a entry à toa."""
+    if var.get() != value:
+        var.set(value)
+
+
+def _decode_thumbnail(img_path: str) -> Image.Image:
+    """Abre e reduz o crop para o preview (só PIL: pode rodar fora da thread do Tk)."""
+    pil_img = Image.open(img_path)
+    # JPEG decodifica já reduzido; PNG (crops do app) ignora o draft
+    pil_img.draft(None, THUMB_MAX_SIZE)
+    # preview de até 400px: bilinear não se distingue do LANCZOS e custa bem menos
+    pil_img.thumbnail(THUMB_MAX_SIZE, Image.Resampling.BILINEAR)
+    return pil_img
+
+
+@lru_cache(maxsize=256)
+def _format_title(name: str, variation: str, gen_raw: str) -> str:
+    """Monta o título "Nome Variação - $gen/s" (campos já com strip)."""
+    base = (name + (" " + variation if variation else "")).strip()
+
+    if not gen_raw:
+        return base
+
+    # Normaliza gen_raw para algo tipo "$12.5M/s"
+    t = gen_raw.replace(" ", "")
+    # se já parece algo como "$xx/s", só limpa levemente
+    if "$" in t and "/s" in t:
+        gen_norm = t
+    else:
+        # tira símbolos soltos e recompõe
+        t = t.replace("$", "")
+        t = _GEN_SUFFIX_RE.sub("", t)
+        gen_norm = f"${t}/s"
+
+    return f"{base} - {gen_norm}" if base else gen_norm
+
+
 # -------------------------------------------------------------------
 # Resultado final da revisão (o que volta pro fluxo principal)
 # -------------------------------------------------------------------
@@ -82,6 +219,25 @@ class BrainrotReviewResult:
     image_path: str
 
 
+# -------------------------------------------------------------------
+# Estado editável de cada página do wizard
+# -------------------------------------------------------------------
+
+@dataclass(slots=True)
+class _ReviewItem:
+    image_path: str
+    image_exists: bool  # checado uma vez ao montar a lista, não a cada página
+    ocr_name: str
+    name: str
+    variation: str
+    gen: str
+    use_default_desc: bool
+    description: str
+    quantity: int
+    price: Decimal
+    title: str = ""
+
+
 # -------------------------------------------------------------------
 # Janela de resumo final
 # -------------------------------------------------------------------
@@ -102,54 +258,88 @@ class BrainrotSummaryWindow(ctk.CTkToplevel):
         self.items = items
         self.on_confirm = on_confirm
 
+        # textos de cada item montados uma vez; as linhas só trocam o texto
+        self._row_texts = [
+            (
+                f"#{idx}  {item.title}",
+                f"Name: {item.name}"
+                f"\nVariation: {item.variation or '-'}"
+                f"\nGen/s: {item.gen_per_s or '-'}"
+                f"\nQuantity: {item.quantity}   Price: {item.price:.2f}",
+            )
+            for idx, item in enumerate(items, start=1)
+        ]
+        self._rows: list[tuple[ctk.CTkLabel, ctk.CTkLabel]] = []
+        self._top = 0
+        self._scrollbar: Optional[ctk.CTkScrollbar] = None
+
         # Layout
         self._build_ui()
 
     def _build_ui(self):
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        accent = PALETTE["accent"]
+        accent_hover = PALETTE["accent_hover"]
+        muted = PALETTE["muted"]
+        muted_hover = PALETTE["muted_hover"]
+        text_primary = PALETTE["text_primary"]
+        text_secondary = PALETTE["text_secondary"]
+
         title = ctk.CTkLabel(
             self,
             text="Review summary",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(18, "bold"),
+            text_color=text_primary,
         )
         title.pack(anchor="w", padx=20, pady=(15, 5))
 
         subtitle = ctk.CTkLabel(
             self,
             text="These brainrots will be added to the CSV. Confirm to continue.",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         )
         subtitle.pack(anchor="w", padx=20, pady=(0, 10))
 
-        # Scrollable area
-        frame_scroll = ctk.CTkScrollableFrame(self, fg_color="#373737", height=260)
-        frame_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+        # Lista: só SUMMARY_VISIBLE_ROWS linhas de widgets, reaproveitadas na
+        # rolagem (o texto muda, os widgets não são recriados por item)
+        list_frame = ctk.CTkFrame(self, fg_color="#373737")
+        list_frame.pack(fill="both", expand=True, padx=20, pady=(0, 10))
 
-        for idx, item in enumerate(self.items, start=1):
-            row = ctk.CTkFrame(frame_scroll, fg_color="#414141")
+        rows_frame = ctk.CTkFrame(list_frame, fg_color="transparent")
+
+        header_font = get_font(14, "bold")
+        for _ in range(min(len(self.items), SUMMARY_VISIBLE_ROWS)):
+            row = ctk.CTkFrame(rows_frame, fg_color="#414141")
             row.pack(fill="x", padx=5, pady=5)
 
             header = ctk.CTkLabel(
                 row,
-                text=f"#{idx}  {item.title}",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                text="",
+                font=header_font,
                 text_color="#F9FAFB",
             )
             header.pack(anchor="w", padx=10, pady=(6, 0))
 
-            info = (
-                f"Name: {item.name}"
-                f"\nVariation: {item.variation or '-'}"
-                f"\nGen/s: {item.gen_per_s or '-'}"
-                f"\nQuantity: {item.quantity}   Price: {item.price:.2f}"
-            )
             lbl = ctk.CTkLabel(
                 row,
-                text=info,
+                text="",
                 text_color="#D1D5DB",
                 justify="left",
             )
             lbl.pack(anchor="w", padx=10, pady=(2, 8))
+            self._rows.append((header, lbl))
+
+        if len(self.items) > SUMMARY_VISIBLE_ROWS:
+            self._scrollbar = ctk.CTkScrollbar(list_frame, command=self._on_scrollbar)
+            self._scrollbar.pack(side="right", fill="y", padx=(0, 4), pady=5)
+            # bind no toplevel vale para todos os filhos (Windows/macOS e Linux)
+            self.bind("<MouseWheel>", self._on_mousewheel)
+            self.bind("<Button-4>", lambda _e: self._scroll_to(self._top - 1))
+            self.bind("<Button-5>", lambda _e: self._scroll_to(self._top + 1))
+
+        # depois da scrollbar, para ela manter a largura dela no pack
+        rows_frame.pack(side="left", fill="both", expand=True)
+        self._render_rows()
 
         # Buttons row
         btn_row = ctk.CTkFrame(self, fg_color="transparent")
@@ -158,8 +348,8 @@ class BrainrotSummaryWindow(ctk.CTkToplevel):
         btn_cancel = ctk.CTkButton(
             btn_row,
             text="Back",
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
+            fg_color=muted,
+            hover_color=muted_hover,
             text_color="white",
             width=110,
             command=self._on_back,
@@ -169,14 +359,47 @@ class BrainrotSummaryWindow(ctk.CTkToplevel):
         btn_ok = ctk.CTkButton(
             btn_row,
             text="Confirm",
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
+            fg_color=accent,
+            hover_color=accent_hover,
             text_color="black",
             width=110,
             command=self._on_confirm,
         )
         btn_ok.pack(side="right")
 
+    # ----------------------------------------------------------------
+    # Rolagem da lista (linhas reaproveitadas)
+    # ----------------------------------------------------------------
+    def _render_rows(self):
+        for offset, (header, lbl) in enumerate(self._rows):
+            header_text, info_text = self._row_texts[self._top + offset]
+            header.configure(text=header_text)
+            lbl.configure(text=info_text)
+
+        if self._scrollbar is not None:
+            total = len(self._row_texts)
+            self._scrollbar.set(self._top / total, (self._top + len(self._rows)) / total)
+
+    def _scroll_to(self, top: int):
+        top = max(0, min(top, len(self._row_texts) - len(self._rows)))
+        if top != self._top:
+            self._top = top
+            self._render_rows()
+
+    def _on_mousewheel(self, event):
+        # em cima da scrollbar ela mesma já rola (via _on_scrollbar)
+        if str(event.widget).startswith(str(self._scrollbar)):
+            return
+        self._scroll_to(self._top + (-1 if event.delta > 0 else 1))
+
+    def _on_scrollbar(self, action: str, value, unit: str | None = None):
+        # mesmo protocolo do yscrollcommand do Tk: "moveto f" ou "scroll n units|pages"
+        if action == "moveto":
+            self._scroll_to(round(float(value) * len(self._row_texts)))
+        elif action == "scroll":
+            step = len(self._rows) if unit == "pages" else 1
+            self._scroll_to(self._top + int(value) * step)
+
     def _on_back(self):
         self.grab_release()
         self.destroy()
@@ -197,6 +420,9 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
     Mostra UM brainrot por vez para revisão.
     """
 
+    # worker único compartilhado: decodifica os previews fora da thread do Tk
+    _thumb_executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(
         self,
         master: ctk.CTk,
@@ -214,9 +440,15 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         self.on_done = on_done
 
         # Normaliza dados de entrada para uma lista de dicts editáveis
-        self.items: List[dict] = self._build_initial_items(brainrots)
+        self.items: List[_ReviewItem] = self._build_initial_items(brainrots)
         self.current_index: int = 0
         self._image_cache: Optional[ctk.CTkImage] = None
+        # previews já decodificados por caminho (Prev/Next não redecodifica)
+        self._thumb_cache: OrderedDict[str, ctk.CTkImage] = OrderedDict()
+        # caminho -> decode em andamento no worker
+        self._thumb_pending: dict[str, Future] = {}
+        # janela já destruída: decodes que terminarem depois são ignorados
+        self._closed = False
 
         # CTk variables
         self.var_name = tk.StringVar()
@@ -226,9 +458,15 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         self.var_use_default_desc = tk.BooleanVar(value=True)
         self.var_quantity = tk.StringVar(value="1")
         self.var_price = tk.StringVar(value="0.00")
+        # after() pendente do preview do título (várias teclas viram um update)
+        self._title_after_id: Optional[str] = None
+        # False enquanto o load da página preenche nome/variação/gen
+        self._title_trace_enabled = True
 
         # Widgets referenciados
         self.txt_description: Optional[ctk.CTkTextbox] = None
+        # descrição padrão já escrita (e travada) no textbox; None = editável
+        self._desc_shown: Optional[str] = None
         self.lbl_index: Optional[ctk.CTkLabel] = None
         self.btn_prev: Optional[ctk.CTkButton] = None
         self.btn_next: Optional[ctk.CTkButton] = None
@@ -248,30 +486,31 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
     # Construção dos dados iniciais
     # ----------------------------------------------------------------
 
-    def _build_initial_items(self, brainrots: List[object]) -> List[dict]:
-        items: List[dict] = []
+    def _build_initial_items(self, brainrots: List[object]) -> List[_ReviewItem]:
+        items: List[_ReviewItem] = []
         for br in brainrots:
             ocr_name = (getattr(br, "nome", "") or "").strip()
             ocr_gen = (getattr(br, "geracao_por_segundo", "") or "").strip()
             ocr_var = (getattr(br, "variation", "") or "").strip()
             img_path = str(getattr(br, "imagem_full_path", "") or "")
 
-            # Ajusta nome com base no catálogo
+            # Ajusta nome com base no catálogo (nomes repetidos saem do cache)
             matched = best_catalog_match(ocr_name, BRAINROT_NAMES) if ocr_name else None
             name_for_user = matched or ocr_name
 
             items.append(
-                {
-                    "image_path": img_path,
-                    "ocr_name": ocr_name,
-                    "name": name_for_user,
-                    "variation": ocr_var,
-                    "gen": ocr_gen,
-                    "use_default_desc": True,
-                    "description": self.default_description,
-                    "quantity": 1,
-                    "price": "0.00",
-                }
+                _ReviewItem(
+                    image_path=img_path,
+                    image_exists=bool(img_path) and Path(img_path).exists(),
+                    ocr_name=ocr_name,
+                    name=name_for_user,
+                    variation=ocr_var,
+                    gen=ocr_gen,
+                    use_default_desc=True,
+                    description=self.default_description,
+                    quantity=1,
+                    price=Decimal("0.00"),
+                )
             )
         return items
 
@@ -280,6 +519,16 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
     # ----------------------------------------------------------------
 
     def _build_ui(self):
+        # cores da tela em locais (um lookup no PALETTE por cor, não por widget)
+        accent = PALETTE["accent"]
+        accent_hover = PALETTE["accent_hover"]
+        entry_bg = PALETTE["entry_bg"]
+        entry_border = PALETTE["entry_border"]
+        muted = PALETTE["muted"]
+        muted_hover = PALETTE["muted_hover"]
+        text_primary = PALETTE["text_primary"]
+        text_secondary = PALETTE["text_secondary"]
+
         # Título
         header = ctk.CTkFrame(self, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=(15, 5))
@@ -287,15 +536,15 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         lbl_title = ctk.CTkLabel(
             header,
             text="Review brainrot",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=PALETTE["text_primary"],
+            font=get_font(18, "bold"),
+            text_color=text_primary,
         )
         lbl_title.pack(side="left")
 
         self.lbl_index = ctk.CTkLabel(
             header,
             text="",
-            text_color=PALETTE["text_secondary"],
+            text_color=text_secondary,
         )
         self.lbl_index.pack(side="right")
 
@@ -321,32 +570,19 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         # Name
         row_name = ctk.CTkFrame(right, fg_color="transparent")
         row_name.pack(fill="x", padx=10, pady=(10, 5))
-        
-        """ctk.CTkLabel(
-            row_name,
-            text="Name:",
-            text_color=PALETTE["text_primary"],
-        ).pack(side="left")
-        self.entry_name = ctk.CTkEntry(
-            row_name,
-            textvariable=self.var_name,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
-        )
-        self.entry_name.pack(side="left", fill="x", expand=True, padx=(8, 0))"""
 
         ctk.CTkLabel(
             row_name,
             text="Name:",
-            text_color=PALETTE["text_secondary"]
+            text_color=text_secondary
         ).pack(side="left")
         
         self.entry_name = AutocompleteEntry(
             row_name,
             textvariable=self.var_name,
             suggestions=BRAINROT_NAMES,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            fg_color=entry_bg,
+            text_color=text_primary,
         )
         self.entry_name.pack(side="left", padx=(8, 0), fill="x", expand=True)
 
@@ -362,7 +598,7 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         self.entry_var = ctk.CTkEntry(
             row_var,
             textvariable=self.var_variation,
-            fg_color=PALETTE["entry_bg"],
+            fg_color=entry_bg,
             text_color="#F9FAFB",
         )
         self.entry_var.pack(side="left", fill="x", expand=True, padx=(8, 0))
@@ -378,7 +614,7 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         self.entry_gen = ctk.CTkEntry(
             row_gen,
             textvariable=self.var_gen,
-            fg_color=PALETTE["entry_bg"],
+            fg_color=entry_bg,
             text_color="#F9FAFB",
         )
         self.entry_gen.pack(side="left", fill="x", expand=True, padx=(8, 0))
@@ -394,7 +630,7 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         self.entry_title = ctk.CTkEntry(
             row_title,
             textvariable=self.var_title,
-            fg_color=PALETTE["entry_bg"],
+            fg_color=entry_bg,
             text_color="#FBBF24",
         )
         self.entry_title.pack(side="left", fill="x", expand=True, padx=(8, 0))
@@ -408,8 +644,8 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
             variable=self.var_use_default_desc,
             text_color="#E5E7EB",
             command=self._on_toggle_default_desc,
-            fg_color=PALETTE["entry_bg"],
-            border_color=PALETTE["entry_border"],
+            fg_color=entry_bg,
+            border_color=entry_border,
             checkmark_color="#E5A000",
         )
         chk.pack(anchor="w")
@@ -427,10 +663,10 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         self.txt_description = ctk.CTkTextbox(
             row_desc,
             height=120,
-            fg_color=PALETTE["entry_bg"],
+            fg_color=entry_bg,
             text_color="#F9FAFB",
             border_width=2,
-            border_color=PALETTE["entry_border"],
+            border_color=entry_border,
         )
         self.txt_description.pack(fill="both", expand=True, pady=(4, 0))
 
@@ -448,14 +684,14 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
             row_qp,
             width=80,
             textvariable=self.var_quantity,
-            fg_color=PALETTE["entry_bg"],
+            fg_color=entry_bg,
             text_color="#F9FAFB",
         )
         self.entry_qty.pack(side="left", padx=(5, 15))
 
         # Price
-        # registrar função de validação do Tk/CTk
-        validate_cmd = self.register(self._validate_preco)
+        # função de validação do Tk/CTk (registrada uma vez por root)
+        validate_cmd = self._get_preco_vcmd()
         
         ctk.CTkLabel(
             row_qp,
@@ -466,8 +702,8 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
             row_qp,
             width=80,
             textvariable=self.var_price,
-            fg_color=PALETTE["entry_bg"],
-            text_color=PALETTE["text_primary"],
+            fg_color=entry_bg,
+            text_color=text_primary,
             validate="key",
             validatecommand=(validate_cmd, "%P"),  # %P = novo valor proposto
         )
@@ -486,8 +722,8 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
             footer,
             text="Previous",
             width=110,
-            fg_color=PALETTE["muted"],
-            hover_color=PALETTE["muted_hover"],
+            fg_color=muted,
+            hover_color=muted_hover,
             text_color="white",
             command=self._on_prev,
         )
@@ -497,8 +733,8 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
             footer,
             text="Next",
             width=110,
-            fg_color=PALETTE["accent"],
-            hover_color=PALETTE["accent_hover"],
+            fg_color=accent,
+            hover_color=accent_hover,
             text_color="black",
             command=self._on_next,
         )
@@ -506,35 +742,96 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
 
         # Atualiza preview do título quando nome/var/gen mudarem
         for v in (self.var_name, self.var_variation, self.var_gen):
-            v.trace_add("write", lambda *_: self._update_title_preview())
+            v.trace_add("write", self._schedule_title_update)
 
     # ----------------------------------------------------------------
     # Carregar / salvar estado da página atual
     # ----------------------------------------------------------------
+    def destroy(self):
+        self._closed = True
+        self._cancel_title_update()
+        # decodes ainda na fila nem começam; os em andamento são ignorados
+        for future in self._thumb_pending.values():
+            future.cancel()
+        self._thumb_pending.clear()
+        super().destroy()
+
+    def _schedule_title_update(self, *_):
+        if not self._title_trace_enabled:
+            return
+        self._cancel_title_update()
+        self._title_after_id = self.after(
+            TITLE_PREVIEW_DEBOUNCE_MS, self._update_title_preview
+        )
+
+    def _cancel_title_update(self):
+        if self._title_after_id is not None:
+            self.after_cancel(self._title_after_id)
+            self._title_after_id = None
+
     def _update_title_preview(self):
-        name = self.var_name.get().strip()
-        variation = self.var_variation.get().strip()
-        gen_raw = self.var_gen.get().strip()
+        # chamada direta (load/save) também descarta o update agendado
+        self._cancel_title_update()
+        _set_if_changed(
+            self.var_title,
+            _format_title(
+                self.var_name.get().strip(),
+                self.var_variation.get().strip(),
+                self.var_gen.get().strip(),
+            ),
+        )
 
-        base = (name + (" " + variation if variation else "")).strip()
+    @classmethod
+    def _get_thumb_executor(cls) -> ThreadPoolExecutor:
+        if cls._thumb_executor is None:
+            cls._thumb_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="review-thumb"
+            )
+        return cls._thumb_executor
 
-        if not gen_raw:
-            self.var_title.set(base)
+    def _request_thumbnail(self, img_path: str):
+        """Agenda o decode do preview no worker (uma vez por caminho)."""
+        if img_path in self._thumb_cache or img_path in self._thumb_pending:
             return
+        future = self._get_thumb_executor().submit(_decode_thumbnail, img_path)
+        self._thumb_pending[img_path] = future
+        future.add_done_callback(lambda f: self._on_thumb_decoded(img_path, f))
 
-        # Normaliza gen_raw para algo tipo "$12.5M/s"
-        t = gen_raw.replace(" ", "")
-        # se já parece algo como "$xx/s", só limpa levemente
-        if "$" in t and "/s" in t:
-            gen_norm = t
-        else:
-            # tira símbolos soltos e recompõe
-            t = t.replace("$", "")
-            t = re.sub(r"/s$", "", t, flags=re.IGNORECASE)
-            gen_norm = f"${t}/s"
+    def _on_thumb_decoded(self, img_path: str, future: Future):
+        # roda na thread do worker: só agenda a aplicação na thread do Tk
+        if self._closed or future.cancelled():
+            return
+        try:
+            self.after(0, lambda: self._apply_thumbnail(img_path, future))
+        except (RuntimeError, tk.TclError):
+            # janela já foi fechada
+            pass
 
-        title = f"{base} - {gen_norm}" if base else gen_norm
-        self.var_title.set(title)
+    def _apply_thumbnail(self, img_path: str, future: Future):
+        if self._closed:
+            return
+        self._thumb_pending.pop(img_path, None)
+        thumb = None
+        if future.exception() is None:
+            pil_img = future.result()
+            # CTkImage cria PhotoImage: só na thread do Tk
+            thumb = ctk.CTkImage(light_image=pil_img, size=pil_img.size)
+            self._thumb_cache[img_path] = thumb
+            if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+
+        # a página pode ter mudado enquanto o worker decodificava
+        if self.items[self.current_index].image_path == img_path:
+            self._show_thumbnail(thumb)
+
+    def _show_thumbnail(self, thumb: Optional[ctk.CTkImage], text: str = "(no image)"):
+        if thumb is not None:
+            self._image_cache = thumb
+            if self.lbl_image:
+                self.lbl_image.configure(image=self._image_cache, text="")
+        else:
+            if self.lbl_image:
+                self.lbl_image.configure(image=None, text=text)
 
     def _load_current_item(self):
         item = self.items[self.current_index]
@@ -545,38 +842,43 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
                 text=f"{self.current_index + 1} / {len(self.items)}"
             )
 
-        # imagem
-        img_path = item.get("image_path") or ""
-        if img_path and Path(img_path).exists():
-            pil_img = Image.open(img_path)
-            # tamanho máximo do preview
-            max_w, max_h = 400, 400
-            pil_img.thumbnail((max_w, max_h), Image.LANCZOS)
-            self._image_cache = ctk.CTkImage(light_image=pil_img, size=pil_img.size)
-            if self.lbl_image:
-                self.lbl_image.configure(image=self._image_cache, text="")
+        # imagem (decode no worker; a página aparece na hora e o preview chega depois)
+        if not item.image_exists:
+            self._show_thumbnail(None)
+        elif item.image_path in self._thumb_cache:
+            self._thumb_cache.move_to_end(item.image_path)
+            self._show_thumbnail(self._thumb_cache[item.image_path])
         else:
-            if self.lbl_image:
-                self.lbl_image.configure(image=None, text="(no image)")
+            self._show_thumbnail(None, text="(loading...)")
+            self._request_thumbnail(item.image_path)
 
-        # campos
-        self.var_name.set(item.get("name", ""))
-        self.var_variation.set(item.get("variation", ""))
-        self.var_gen.set(item.get("gen", ""))
+        # campos (set programático: o título é refeito uma vez lá embaixo,
+        # não pelos traces)
+        self._title_trace_enabled = False
+        try:
+            _set_if_changed(self.var_name, item.name)
+            _set_if_changed(self.var_variation, item.variation)
+            _set_if_changed(self.var_gen, item.gen)
+        finally:
+            self._title_trace_enabled = True
 
         # descrição / checkbox
-        self.var_use_default_desc.set(bool(item.get("use_default_desc", True)))
-        desc_text = item.get("description", self.default_description)
+        _set_if_changed(self.var_use_default_desc, item.use_default_desc)
+        desc_text = item.description
 
         if self.txt_description:
-            self.txt_description.configure(state="normal")
-            self.txt_description.delete("1.0", "end")
-            self.txt_description.insert("1.0", desc_text)
+            if not item.use_default_desc and (
+                self.txt_description.get("1.0", "end-1c") != desc_text
+            ):
+                self.txt_description.configure(state="normal")
+                self.txt_description.delete("1.0", "end")
+                self.txt_description.insert("1.0", desc_text)
+            # com o padrão marcado, o _apply_desc_state escreve (se precisar)
             self._apply_desc_state()
 
         # quantity / price
-        self.var_quantity.set(str(item.get("quantity", 1)))
-        self.var_price.set(str(item.get("price", "0.00")))
+        _set_if_changed(self.var_quantity, str(item.quantity))
+        _set_if_changed(self.var_price, str(item.price))
 
         # título
         self._update_title_preview()
@@ -590,36 +892,59 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
                 text="Finish" if self.current_index == len(self.items) - 1 else "Next"
             )
 
+        # adianta os previews das vizinhas enquanto o usuário revisa esta
+        # (a próxima primeiro: o caminho comum é Next)
+        for vizinho in (self.current_index + 1, self.current_index - 1):
+            if 0 <= vizinho < len(self.items) and self.items[vizinho].image_exists:
+                self._request_thumbnail(self.items[vizinho].image_path)
+
     def _apply_desc_state(self):
         if not self.txt_description:
             return
         if self.var_use_default_desc.get():
+            if self._desc_shown == self.default_description:
+                # padrão já está no textbox e travado: nada a fazer
+                return
             # força descrição padrão e bloqueia
             self.txt_description.configure(state="normal")
             self.txt_description.delete("1.0", "end")
             self.txt_description.insert("1.0", self.default_description)
             self.txt_description.configure(state="disabled")
+            self._desc_shown = self.default_description
         else:
             self.txt_description.configure(state="normal")
+            # a partir daqui o texto pode ser editado
+            self._desc_shown = None
 
     # ----------------------------------------------------------------
     # Handlers
     # ----------------------------------------------------------------
-    def _validate_preco(self, new_value: str) -> bool:
+    _preco_vcmd: Optional[str] = None
+
+    def _get_preco_vcmd(self) -> str:
+        """
+        Registra _validate_preco no Tcl só uma vez (no root) e reutiliza
+        o nome do comando nas próximas janelas, em vez de criar um comando
+        novo a cada review aberta.
+        """
+        cls = BrainrotReviewWindow
+        if cls._preco_vcmd is None:
+            cls._preco_vcmd = self._root().register(cls._validate_preco)
+        return cls._preco_vcmd
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _validate_preco(new_value: str) -> bool:
         """
         Valida o campo de preço em tempo real:
         - permite apenas dígitos e ponto
         - no máximo um ponto
         - permite vazio (pra não travar o backspace)
-        """
-        # Permitir vazio (user limpando o campo)
-        if new_value == "":
-            return True
 
-        # Regex: qualquer quantidade de dígitos, opcionalmente um ponto, depois mais dígitos
-        # exemplos aceitos: "1", "12", "12.", "12.3", "0.99", ".5" (vamos arrumar no focus out)
-        padrao = r"^\d*\.?\d*$"
-        return re.match(padrao, new_value) is not None
+        Função pura, então o resultado fica em cache (digitar/apagar repete valores).
+        """
+        # vazio casa com o padrão também (user limpando o campo)
+        return _PRECO_RE.fullmatch(new_value) is not None
 
     def _on_preco_focus_out(self, event=None):
         """
@@ -630,24 +955,22 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         """
         texto = self.entry_preco.get().strip()
 
-        if texto == "" or texto == ".":
+        if texto == "" or texto == "." or _PRECO_RE.fullmatch(texto) is None:
+            # vazio/incompleto (ou algo que escapou do validatecommand): zera
             valor = Decimal("0.00")
         else:
+            # regex já garantiu dígitos + no máximo um ponto, Decimal não falha;
             # se começar com ponto, adiciona zero: ".5" -> "0.5"
             if texto.startswith("."):
                 texto = "0" + texto
-
-            try:
-                valor = Decimal(texto)
-            except Exception:
-                # se der qualquer problema, zera
-                valor = Decimal("0.00")
+            valor = Decimal(texto)
 
         # formata sempre com 2 casas decimais
         texto_formatado = f"{valor:.2f}"
 
-        self.entry_preco.delete(0, "end")
-        self.entry_preco.insert(0, texto_formatado)
+        if texto_formatado != texto:
+            self.entry_preco.delete(0, "end")
+            self.entry_preco.insert(0, texto_formatado)
 
     
     def _on_toggle_default_desc(self):
@@ -676,6 +999,10 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         """Valida e grava os dados da página atual em self.items."""
         item = self.items[self.current_index]
 
+        # título ainda com update pendente: aplica agora antes de ler
+        if self._title_after_id is not None:
+            self._update_title_preview()
+
         name = self.var_name.get().strip()
         gen = self.var_gen.get().strip()
         variation = self.var_variation.get().strip()
@@ -748,14 +1075,14 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
             return False
 
         # atualiza item
-        item["name"] = name
-        item["variation"] = variation
-        item["gen"] = gen
-        item["title"] = title
-        item["use_default_desc"] = use_default_desc
-        item["description"] = desc
-        item["quantity"] = quantity
-        item["price"] = f"{price:.2f}"
+        item.name = name
+        item.variation = variation
+        item.gen = gen
+        item.title = title
+        item.use_default_desc = use_default_desc
+        item.description = desc
+        item.quantity = quantity
+        item.price = price.quantize(_CENTAVOS)
 
         return True
 
@@ -766,28 +1093,19 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
     def _build_results(self) -> List[BrainrotReviewResult]:
         results: List[BrainrotReviewResult] = []
         for item in self.items:
-            name = item.get("name", "").strip()
-            variation = item.get("variation", "").strip()
-            gen = item.get("gen", "").strip()
-            image_path = item.get("image_path", "")
-
-            # Recalcula título pra garantir consistência
-            base = (name + (" " + variation if variation else "")).strip()
-            if gen:
-                t = gen.replace(" ", "")
-                if "$" in t and "/s" in t:
-                    gen_norm = t
-                else:
-                    t = t.replace("$", "")
-                    t = re.sub(r"/s$", "", t, flags=re.IGNORECASE)
-                    gen_norm = f"${t}/s"
-                title = f"{base} - {gen_norm}" if base else gen_norm
-            else:
-                title = base
+            name = item.name.strip()
+            variation = item.variation.strip()
+            gen = item.gen.strip()
+            image_path = item.image_path
+
+            # título já gravado pelo _save_current (o mesmo do preview, inclusive
+            # se o usuário editou); só recalcula se ficou vazio
+            title = item.title or _format_title(name, variation, gen)
 
-            desc = item.get("description", self.default_description)
-            qty = int(item.get("quantity", 1))
-            price = float(str(item.get("price", "0.00")).replace(",", "."))
+            desc = item.description
+            qty = item.quantity
+            # float só na saída (BrainrotReviewResult.price)
+            price = float(item.price)
 
             results.append(
                 BrainrotReviewResult(
@@ -795,7 +1113,7 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
                     variation=variation,
                     gen_per_s=gen,
                     title=title,
-                    use_default_desc=bool(item.get("use_default_desc", True)),
+                    use_default_desc=item.use_default_desc,
                     description=desc,
                     quantity=qty,
                     price=price,
@@ -833,148 +1151,3 @@ class BrainrotReviewWindow(ctk.CTkToplevel):
         # Abre a janela de resumo passando a lista de BrainrotReviewResult
         BrainrotSummaryWindow(self, results, on_confirm=_on_confirm)
 
-
-# ======================================================================
-# AutocompleteEntry (Name field)
-# ======================================================================
-class AutocompleteEntry(ctk.CTkEntry):
-    def __init__(
-        self,
-        master,
-        suggestions: list[str],
-        on_select=None,
-        *args,
-        **kwargs,
-    ):
-        super().__init__(master, *args, **kwargs)
-        self.suggestions = suggestions
-        self.on_select = on_select  # callback ao selecionar
-
-        self._dropdown: tk.Toplevel | None = None
-        self._listbox: tk.Listbox | None = None
-
-        self.bind("<KeyRelease>", self._on_keyrelease)
-        self.bind("<Down>", self._on_down)
-        self.bind("<Return>", self._on_return)
-        self.bind("<FocusOut>", self._on_focus_out)
-
-        # estilo do dropdown
-        self.dropdown_bg = "#2F2F2F"
-        self.dropdown_border = "#2F2F2F"
-        self.dropdown_text = "#F9FAFB"
-        self.dropdown_select_bg = "#E5A000"
-        self.dropdown_select_fg = "#000000"
-
-    # --------------------------------------------------
-    # helpers de dropdown / listbox
-    # --------------------------------------------------
-    def _create_dropdown(self):
-        if self._dropdown is not None:
-            return
-
-        self._dropdown = tk.Toplevel(self)
-        self._dropdown.wm_overrideredirect(True)
-        self._dropdown.configure(bg=self.dropdown_border)
-
-        x = self.winfo_rootx()
-        y = self.winfo_rooty() + self.winfo_height()
-        self._dropdown.geometry(f"+{x}+{y}")
-
-        frame = tk.Frame(self._dropdown, bg=self.dropdown_border, bd=2)
-        frame.pack(fill="both", expand=True)
-
-        self._listbox = tk.Listbox(
-            frame,
-            height=6,
-            borderwidth=0,
-            highlightthickness=0,
-            background=self.dropdown_bg,
-            foreground=self.dropdown_text,
-            selectbackground=self.dropdown_select_bg,
-            selectforeground=self.dropdown_select_fg,
-            relief="flat",
-            font=("Segoe UI", 11),
-        )
-        self._listbox.pack(fill="both", expand=True, padx=4, pady=3)
-
-        self._listbox.bind("<<ListboxSelect>>", self._on_listbox_click)
-        self._listbox.bind("<ButtonRelease-1>", self._on_listbox_click)
-
-    def _destroy_dropdown(self):
-        if self._dropdown is not None:
-            self._dropdown.destroy()
-            self._dropdown = None
-            self._listbox = None
-
-    # --------------------------------------------------
-    # eventos
-    # --------------------------------------------------
-    def _on_keyrelease(self, event):
-        if event.keysym in ("Return", "Up", "Down"):
-            return
-
-        text = self.get().strip()
-        if not text:
-            self._destroy_dropdown()
-            return
-
-        lowercase = text.lower()
-        matches = [s for s in self.suggestions if lowercase in s.lower()]
-
-        if not matches:
-            self._destroy_dropdown()
-            return
-
-        self._create_dropdown()
-        assert self._listbox is not None
-        self._listbox.delete(0, tk.END)
-        for item in matches:
-            self._listbox.insert(tk.END, f"  {item}  ")
-
-        self._listbox.selection_clear(0, tk.END)
-        self._listbox.selection_set(0)
-        self._listbox.activate(0)
-
-    def _on_down(self, event):
-        if self._listbox is None:
-            return "break"
-        cur = self._listbox.curselection()
-        if not cur:
-            idx = 0
-        else:
-            idx = cur[0] + 1
-        if idx >= self._listbox.size():
-            idx = self._listbox.size() - 1
-        self._listbox.selection_clear(0, tk.END)
-        self._listbox.selection_set(idx)
-        self._listbox.activate(idx)
-        return "break"
-
-    def _on_return(self, event):
-        if self._listbox is not None:
-            self._apply_selection()
-            return "break"
-
-    def _on_focus_out(self, event):
-        self.after(150, self._destroy_dropdown)
-
-    def _on_listbox_click(self, event):
-        self._apply_selection()
-
-    # --------------------------------------------------
-    # seleção de item
-    # --------------------------------------------------
-    def _apply_selection(self):
-        if self._listbox is None:
-            return
-        cur = self._listbox.curselection()
-        if not cur:
-            return
-
-        text = self._listbox.get(cur[0]).strip()
-        self.delete(0, tk.END)
-        self.insert(0, text)
-        self._destroy_dropdown()
-
-        if callable(self.on_select):
-            self.on_select(text)
\ No newline at end of file
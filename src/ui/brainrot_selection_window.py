@@ -11,23 +11,40 @@ from typing import List, Callable
 from PIL import Image, ImageTk
 from tkinter import messagebox  # para avisos
 
-from difflib import SequenceMatcher
-from src.core.brainrots_data import BRAINROT_NAMES
 
+# screenshot já reduzida para o canvas: reabrir a seleção do mesmo arquivo
+# (ex.: fechou sem querer) não decodifica/redimensiona de novo. Guarda só a
+# última: screenshots são grandes e raramente há mais de uma em uso.
+# chave (caminho, mtime_ns, tamanho, max_w, max_h) -> (photo, scale_x, scale_y, w, h)
+_DISPLAY_CACHE: dict[tuple, tuple[ImageTk.PhotoImage, float, float, int, int]] = {}
 
-def _normalize_name(s: str) -> str:
-    return " ".join(s.lower().split())
 
+def _load_display_image(
+    image_path: Path, max_width: int, max_height: int
+) -> tuple[ImageTk.PhotoImage, float, float, int, int]:
+    st = image_path.stat()
+    key = (str(image_path), st.st_mtime_ns, st.st_size, max_width, max_height)
+    cached = _DISPLAY_CACHE.get(key)
+    if cached is not None:
+        return cached
 
-def best_catalog_match(query: str, catalog: list[str], min_ratio: float = 0.62) -> str | None:
-    """Retorna o nome do catálogo mais parecido com 'query', se passar do limiar."""
-    q = _normalize_name(query)
-    best_name, best_score = None, 0.0
-    for cand in catalog:
-        score = SequenceMatcher(None, q, _normalize_name(cand)).ratio()
-        if score > best_score:
-            best_name, best_score = cand, score
-    return best_name if best_name and best_score >= min_ratio else None
+    # Carrega imagem original
+    img = Image.open(image_path)
+    orig_w, orig_h = img.size
+
+    # calcula escala pra caber na janela
+    scale = min(max_width / orig_w, max_height / orig_h, 1.0)
+    new_w = int(orig_w * scale)
+    new_h = int(orig_h * scale)
+
+    # JPEG: decodifica já reduzido (1/2, 1/4, 1/8) em vez da resolução
+    # cheia; outros formatos ignoram. A escala acima usa o tamanho original.
+    img.draft(None, (new_w, new_h))
+    photo = ImageTk.PhotoImage(img.resize((new_w, new_h), Image.LANCZOS))
+
+    _DISPLAY_CACHE.clear()
+    _DISPLAY_CACHE[key] = (photo, orig_w / new_w, orig_h / new_h, new_w, new_h)
+    return _DISPLAY_CACHE[key]
 
 
 @dataclass
@@ -73,6 +90,8 @@ class BrainrotSelectionWindow(ctk.CTkToplevel):
 
         # armazenar retângulos
         self.regions: List[SelectedRegion] = []
+        # tag do canvas (retângulo + índice) de cada região, na mesma ordem
+        self._region_tags: List[str] = []
 
         # coords do retângulo atual (em coords do canvas)
         self._start_x: int | None = None
@@ -89,20 +108,10 @@ class BrainrotSelectionWindow(ctk.CTkToplevel):
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_ui(self, max_width: int, max_height: int):
-        # Carrega imagem original
-        img = Image.open(self.image_path)
-        orig_w, orig_h = img.size
-
-        # calcula escala pra caber na janela
-        scale = min(max_width / orig_w, max_height / orig_h, 1.0)
-        new_w = int(orig_w * scale)
-        new_h = int(orig_h * scale)
-
-        self._scale_x = orig_w / new_w
-        self._scale_y = orig_h / new_h
-
-        self._img_display = img.resize((new_w, new_h), Image.LANCZOS)
-        self._photo = ImageTk.PhotoImage(self._img_display)  # manter referência
+        # imagem reduzida para o canvas (cacheada por arquivo/tamanho)
+        self._photo, self._scale_x, self._scale_y, new_w, new_h = _load_display_image(
+            self.image_path, max_width, max_height
+        )  # manter referência
 
         # canvas pra desenhar
         self.canvas = tk.Canvas(
@@ -217,8 +226,13 @@ class BrainrotSelectionWindow(ctk.CTkToplevel):
 
         self.regions.append(SelectedRegion(img_x1, img_y1, img_x2, img_y2))
 
-        # coloca um label com o índice no canto
+        # retângulo e índice ficam sob a mesma tag (o undo apaga só eles)
         idx = len(self.regions)
+        tag = f"region_{idx}"
+        self._region_tags.append(tag)
+        self.canvas.addtag_withtag(tag, self._current_rect_id)
+
+        # coloca um label com o índice no canto
         self.canvas.create_text(
             x1 + 8,
             y1 + 8,
@@ -226,6 +240,7 @@ class BrainrotSelectionWindow(ctk.CTkToplevel):
             anchor="nw",
             fill="#FBBF24",
             font=("Segoe UI", 10, "bold"),
+            tags=(tag,),
         )
 
         # "finaliza" esse retângulo e libera para outro
@@ -239,32 +254,9 @@ class BrainrotSelectionWindow(ctk.CTkToplevel):
         if not self.regions:
             return
 
-        # apaga TUDO e redesenha, mais simples
+        # só a última região sai: as outras (e a imagem) ficam no canvas
         self.regions.pop()
-
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor="nw", image=self._photo)
-
-        # redesenha todos os retângulos e índices
-        for i, r in enumerate(self.regions, start=1):
-            # volta coords pra canvas
-            x1 = r.x1 / self._scale_x
-            y1 = r.y1 / self._scale_y
-            x2 = r.x2 / self._scale_x
-            y2 = r.y2 / self._scale_y
-            self.canvas.create_rectangle(
-                x1, y1, x2, y2,
-                outline="#FBBF24",
-                width=2,
-            )
-            self.canvas.create_text(
-                x1 + 8,
-                y1 + 8,
-                text=str(i),
-                anchor="nw",
-                fill="#FBBF24",
-                font=("Segoe UI", 10, "bold"),
-            )
+        self.canvas.delete(self._region_tags.pop())
 
     def _on_done_click(self):
         # garante pelo menos 1 seleção